@@ -2,16 +2,26 @@
 from __future__ import annotations
 
 import argparse
-import json
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import freeze_support
 from pathlib import Path
 from typing import List
 
-from ocr_app.app import main as gui_main
+import orjson
+
 from ocr_app.config import config
 from ocr_app.core.ocr_service import gather_paths, run_ocr_on_path
 from ocr_app.logging_utils import setup_logging
 
 
+def gui_main() -> None:
+    """Start the GUI, importing the Qt bootstrap only when it is actually needed."""
+
+    from ocr_app.app import main as app_main
+
+    app_main()
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="OCR application")
     subparsers = parser.add_subparsers(dest="command")
@@ -46,7 +56,7 @@ def _parse_args() -> argparse.Namespace:
     ocr_parser.add_argument(
         "--tesseract-cmd",
         type=str,
-        default=config.tesseract_cmd,
+        default=config.models.tesseract_cmd,
         help="Ścieżka do binarki tesseract (opcjonalnie)",
     )
 
@@ -70,35 +80,45 @@ def _run_cli(args: argparse.Namespace) -> None:
         raise SystemExit("Nie znaleziono plików do przetworzenia")
 
     all_results = []
-    for path in input_paths:
-        pages = run_ocr_on_path(
-            path,
-            args.engine,
-            args.languages,
-            preprocess_options=config.preprocess_options,
-            dpi=args.dpi,
-            tesseract_cmd=args.tesseract_cmd,
-        )
-        _print_human_readable(path, args.languages, args.engine, pages)
-        all_results.append(
-            {
-                "source": str(path),
-                "engine": args.engine,
-                "languages": args.languages,
-                "pages": [
-                    {
-                        "page": page.page_index,
-                        "text": page.text,
-                        "confidence": page.confidence,
-                        "boxes": page.boxes,
-                    }
-                    for page in pages
-                ],
-            }
-        )
+    # Several files already keep every worker process busy; only fan out pages of a single file.
+    page_workers = 1 if len(input_paths) > 1 else None
+    with ProcessPoolExecutor(max_workers=config.max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_ocr_on_path,
+                path,
+                args.engine,
+                args.languages,
+                preprocess_options=dict(config.preprocess_options),
+                dpi=args.dpi,
+                tesseract_cmd=args.tesseract_cmd,
+                page_workers=page_workers,
+            )
+            for path in input_paths
+        ]
+        # Files still run in parallel; collecting them in submission order keeps output in input order.
+        for path, future in zip(input_paths, futures):
+            pages = future.result()
+            _print_human_readable(path, args.languages, args.engine, pages)
+            all_results.append(
+                {
+                    "source": str(path),
+                    "engine": args.engine,
+                    "languages": args.languages,
+                    "pages": [
+                        {
+                            "page": page.page_index,
+                            "text": page.text,
+                            "confidence": page.confidence,
+                            "boxes": page.boxes.to_dicts(),
+                        }
+                        for page in pages
+                    ],
+                }
+            )
 
     if args.json_output:
-        args.json_output.write_text(json.dumps(all_results, ensure_ascii=False, indent=2), encoding="utf-8")
+        args.json_output.write_bytes(orjson.dumps(all_results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
         logger.info("Zapisano wynik do %s", args.json_output)
 
 
@@ -111,4 +131,5 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    freeze_support()
     main()
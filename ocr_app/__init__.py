@@ -1,5 +1,20 @@
 """OCR application package initialization."""
 
-from .config import OCRConfig, config, load_config
+from .config import OCRConfig, load_config
+
+# Importing the submodule bound its name here; drop it so ``ocr_app.config``
+# resolves to the settings instance through ``__getattr__`` below.
+del config
 
 __all__ = ["OCRConfig", "config", "load_config"]
+
+
+def __getattr__(name: str):
+    """Load the default configuration on first access to ``config`` (PEP 562)."""
+
+    if name == "config":
+        from .config import config
+
+        globals()["config"] = config
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,20 +1,58 @@
 """FastAPI entrypoint exposing OCR capabilities."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import mimetypes
-import urllib.request
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional
+from tempfile import NamedTemporaryFile
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple, Type, TypeVar
 
+import httpx
 from fastapi import Body, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from .config import config
-from .core.ocr_service import PageOcrResult, run_ocr_on_bytes, run_ocr_on_path
+from .core.ocr_engine import BoxColumns
+from .core.ocr_service import PageOcrResult, run_ocr_on_path
 from .logging_utils import setup_logging
 
 logger = setup_logging()
-app = FastAPI(title="OCR Service")
+app = FastAPI(title="OCR Service", default_response_class=ORJSONResponse)
+
+T = TypeVar("T")
+
+# Upper bound on OCR jobs started per second across all clients.
+MAX_REQUESTS_PER_SECOND = 10.0
+
+_ocr_pool = ProcessPoolExecutor(max_workers=config.max_workers)
+_ocr_semaphore = asyncio.Semaphore(config.max_workers)
+_min_interval = 1.0 / MAX_REQUESTS_PER_SECOND
+_next_slot = [0.0]
+
+# Errors worth retrying a pool job for. Broken pools and a missing tesseract
+# binary fail the same way on every attempt, so they are raised immediately.
+_TRANSIENT_POOL_ERRORS: Tuple[Type[BaseException], ...] = (TimeoutError, ConnectionError, InterruptedError)
+
+# Uploads and downloads are spooled to disk in chunks of this size.
+_CHUNK_SIZE = 1 << 20
+
+# Shared client so repeated downloads reuse TCP/TLS connections (HTTP/2 when offered).
+_http_client = httpx.AsyncClient(
+    http2=True,
+    follow_redirects=True,
+    limits=httpx.Limits(max_connections=config.max_workers),
+)
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class _RetryableHTTPStatus(Exception):
+    """Raised for HTTP responses worth retrying (rate limiting, server errors)."""
 
 
 class BoundingBox(BaseModel):
@@ -44,35 +82,102 @@ class OcrResponse(BaseModel):
     pages: List[PageResponse]
 
 
+def _build_boxes(boxes: BoxColumns) -> List[BoxResult]:
+    # Read the engine's box columns directly; no intermediate dict per box.
+    return [
+        BoxResult.model_construct(
+            text=text,
+            bbox=BoundingBox.model_construct(x=x, y=y, width=width, height=height),
+            confidence=confidence,
+        )
+        for text, x, y, width, height, confidence in boxes.rows()
+    ]
+
+
 def _build_response(source: str, engine: str, languages: List[str], pages: List[PageOcrResult]) -> OcrResponse:
-    return OcrResponse(
+    # The data comes from our own OCR pipeline, so model_construct skips per-box validation.
+    return OcrResponse.model_construct(
         source=source,
         engine=engine,
-        languages=languages,
+        languages=list(languages),
         pages=[
-            PageResponse(
+            PageResponse.model_construct(
                 page=page.page_index,
                 text=page.text,
                 confidence=page.confidence,
-                boxes=[
-                    BoxResult(
-                        text=box.get("text", ""),
-                        bbox=BoundingBox(
-                            x=int((box.get("bbox") or {}).get("x", 0)),
-                            y=int((box.get("bbox") or {}).get("y", 0)),
-                            width=int((box.get("bbox") or {}).get("width", 0)),
-                            height=int((box.get("bbox") or {}).get("height", 0)),
-                        ),
-                        confidence=box.get("confidence"),
-                    )
-                    for box in page.boxes
-                ],
+                boxes=_build_boxes(page.boxes),
             )
             for page in pages
         ],
     )
 
 
+def _retry_async(
+    attempts: int = 3,
+    base_delay: float = 0.5,
+    exceptions: Tuple[Type[BaseException], ...] = (OSError, RuntimeError),
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Retry a coroutine on transient errors, doubling the delay after each attempt."""
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            delay = base_delay
+            for attempt in range(1, attempts):
+                try:
+                    return await func(*args, **kwargs)
+                except exceptions as exc:
+                    logger.warning(
+                        "%s nie powiodło się (próba %d/%d): %s. Ponawiam za %.1fs",
+                        func.__name__,
+                        attempt,
+                        attempts,
+                        exc,
+                        delay,
+                    )
+                    await asyncio.sleep(delay)
+                    delay *= 2
+            return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+async def _throttle(loop: asyncio.AbstractEventLoop) -> None:
+    """Space out OCR job starts so that at most MAX_REQUESTS_PER_SECOND begin per second."""
+
+    now = loop.time()
+    slot = max(now, _next_slot[0])
+    _next_slot[0] = slot + _min_interval
+    await asyncio.sleep(slot - now)
+
+
+def _reset_ocr_pool(broken: ProcessPoolExecutor) -> None:
+    """Replace ``broken`` with a fresh pool unless another request already did."""
+
+    global _ocr_pool
+    if _ocr_pool is broken:
+        _ocr_pool = ProcessPoolExecutor(max_workers=config.max_workers)
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+@_retry_async(exceptions=_TRANSIENT_POOL_ERRORS)
+async def _run_in_pool(func: Callable[..., T], *args: Any) -> T:
+    """Run blocking OCR work in the process pool without stalling the event loop."""
+
+    loop = asyncio.get_running_loop()
+    async with _ocr_semaphore:
+        await _throttle(loop)
+        pool = _ocr_pool
+        try:
+            return await loop.run_in_executor(pool, func, *args)
+        except BrokenProcessPool:
+            logger.error("Pula procesów OCR uległa awarii; tworzę nową")
+            _reset_ocr_pool(pool)
+            raise
+
+
 @app.get("/health")
 def health() -> dict:
     """Simple healthcheck endpoint."""
@@ -80,19 +185,57 @@ def health() -> dict:
     return {"status": "ok"}
 
 
-def _download_url(url: str) -> tuple[bytes, str]:
+def _temp_file(filename: str):
+    """Create a named temp file in ``config.temp_dir`` keeping the original suffix."""
+
+    return NamedTemporaryFile(delete=False, suffix=Path(filename).suffix, dir=config.temp_dir)
+
+
+async def _save_upload(file: UploadFile) -> Path:
+    """Stream an upload to a temporary file without holding it in memory."""
+
+    with _temp_file(file.filename or "") as tmp:
+        try:
+            while chunk := await file.read(_CHUNK_SIZE):
+                tmp.write(chunk)
+        except BaseException:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise
+    return Path(tmp.name)
+
+
+@_retry_async(exceptions=(httpx.TransportError, _RetryableHTTPStatus))
+async def _fetch_to_temp(url: str) -> tuple[Path, str]:
+    async with _http_client.stream("GET", url) as response:
+        if response.status_code in _RETRYABLE_STATUSES:
+            raise _RetryableHTTPStatus(f"HTTP {response.status_code} dla {url}")
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+        extension = mimetypes.guess_extension(content_type) or ""
+        filename = Path(url).name or f"remote{extension}"
+        with _temp_file(filename) as tmp:
+            try:
+                async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                    tmp.write(chunk)
+            except BaseException:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
+    return Path(tmp.name), filename
+
+
+async def _download_url(url: str) -> tuple[Path, str]:
     try:
-        with urllib.request.urlopen(url) as response:  # nosec: B310 - controlled input
-            content_type = response.headers.get_content_type()
-            payload = response.read()
-            extension = mimetypes.guess_extension(content_type) or ""
-            filename = Path(url).name or f"remote{extension}"
-            return payload, filename
+        return await _fetch_to_temp(url)
     except Exception as exc:  # pragma: no cover - network dependent
         logger.error("Nie udało się pobrać pliku z %s: %s", url, exc)
         raise HTTPException(status_code=400, detail="Nie udało się pobrać URL") from exc
 
 
+@app.on_event("shutdown")
+async def _close_http_client() -> None:
+    await _http_client.aclose()
+
+
 @app.post("/ocr", response_model=OcrResponse)
 async def perform_ocr(
     file: Optional[UploadFile] = File(default=None),
@@ -113,42 +256,68 @@ async def perform_ocr(
     selected_engine = engine_body or engine
     selected_languages = languages_body or languages or config.default_languages
     selected_dpi = dpi_body or dpi or config.pdf_dpi
-    preprocess_options = config.preprocess_options
+    # Plain dict: the read-only config mapping cannot be pickled for the process pool.
+    preprocess_options = dict(config.preprocess_options)
     url = url_body or url_form
 
     if not file and not url:
         raise HTTPException(status_code=400, detail="Wymagany jest plik lub URL")
 
     if file:
-        content = await file.read()
-        try:
-            pages = run_ocr_on_bytes(
-                content,
-                file.filename or "upload",
-                selected_engine,
-                selected_languages,
-                preprocess_options,
-                selected_dpi,
-                config.tesseract_cmd,
-            )
-        except ValueError as exc:
-            raise HTTPException(status_code=400, detail=str(exc)) from exc
-        return _build_response(file.filename or "upload", selected_engine, selected_languages, pages)
+        source = file.filename or "upload"
+        target = await _save_upload(file)
+    else:
+        target, source = await _download_url(url or "")
 
-    payload, filename = _download_url(url or "")
     try:
-        pages = run_ocr_on_bytes(
-            payload,
-            filename,
+        pages = await _run_in_pool(
+            run_ocr_on_path,
+            target,
             selected_engine,
             selected_languages,
             preprocess_options,
             selected_dpi,
-            config.tesseract_cmd,
+            config.models.tesseract_cmd,
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
-    return _build_response(filename, selected_engine, selected_languages, pages)
+    finally:
+        target.unlink(missing_ok=True)
+    return _build_response(source, selected_engine, selected_languages, pages)
+
+
+# Directory listings used by /ocr/path existence checks are reused for this many seconds.
+_DIR_LISTING_TTL = 5.0
+_DIR_LISTING_MAX_ENTRIES = 1024
+_dir_listings: Dict[str, Tuple[float, FrozenSet[str]]] = {}
+
+
+def _dir_listing(dirpath: str) -> FrozenSet[str]:
+    """Return the entry names of ``dirpath``, cached for ``_DIR_LISTING_TTL`` seconds."""
+
+    now = time.monotonic()
+    cached = _dir_listings.get(dirpath)
+    if cached is not None and now - cached[0] < _DIR_LISTING_TTL:
+        return cached[1]
+    try:
+        names = frozenset(os.listdir(dirpath))
+    except OSError:
+        names = frozenset()
+    if len(_dir_listings) >= _DIR_LISTING_MAX_ENTRIES:
+        _dir_listings.clear()
+    _dir_listings[dirpath] = (now, names)
+    return names
+
+
+def _path_exists(target: Path) -> bool:
+    """Check existence through the cached listing of the parent directory.
+
+    Many requests for files in the same directory then cost one ``listdir``
+    instead of one ``stat`` each, which is notably slow on Windows. A miss
+    falls back to ``stat`` so files created within the TTL window are found.
+    """
+
+    return target.name in _dir_listing(str(target.parent)) or target.exists()
 
 
 @app.post("/ocr/path", response_model=OcrResponse)
@@ -161,7 +330,7 @@ def perform_ocr_from_path(
     """Run OCR on a server-side path (useful for local deployments)."""
 
     target = Path(path)
-    if not target.exists():
+    if not _path_exists(target):
         raise HTTPException(status_code=404, detail="Plik nie istnieje")
 
     selected_languages = languages or config.default_languages
@@ -174,7 +343,7 @@ def perform_ocr_from_path(
             selected_languages,
             preprocess_options,
             dpi,
-            config.tesseract_cmd,
+            config.models.tesseract_cmd,
         )
     except Exception as exc:  # pragma: no cover - runtime errors
         logger.exception("OCR failed for %s", target)
@@ -37,9 +37,17 @@ def _set_default_font_dir() -> None:
             break
 
 
+_qt_environment_prepared = False
+
+
 def _prepare_qt_environment() -> None:
     """Configure Qt to work in headless containers and avoid sandbox issues."""
 
+    global _qt_environment_prepared
+    if _qt_environment_prepared:
+        return
+    _qt_environment_prepared = True
+
     headless = _is_headless_environment()
 
     if headless:
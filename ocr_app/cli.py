@@ -2,16 +2,23 @@
 from __future__ import annotations
 
 import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from PIL import Image
 
-from .config import OCRConfig, load_config
+from .config import ModelConfig, OCRConfig, load_config
 from .core.exporter import export_docx, export_txt
-from .core.image_preprocess import preprocess_image
-from .core.ocr_engine import OcrEngine
-from .core.pdf_loader import load_pdf_pages
+from .core.image_preprocess import PreprocessOptions, preprocess_image
+from .core.ocr_engine import OcrEngine, get_engine
+from .core.pdf_loader import load_pdf_pages_parallel
+from .core.pipeline import run_staged
+from .core.worker import init_worker_engine
+
+logger = logging.getLogger(__name__)
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -48,6 +55,11 @@ def _build_parser() -> argparse.ArgumentParser:
             default="txt",
             help="Format wyjściowy (txt lub docx).",
         )
+        subparser.add_argument(
+            "--jobs",
+            type=int,
+            help="Liczba procesów roboczych (domyślnie app.max_workers z config.yml).",
+        )
 
     pdf_parser = subparsers.add_parser("pdf", help="Konwersja PDF do tekstu")
     pdf_parser.add_argument("pdf", type=Path, help="Ścieżka do pliku PDF")
@@ -56,6 +68,14 @@ def _build_parser() -> argparse.ArgumentParser:
         type=int,
         help="DPI renderowania stron PDF (domyślnie z config.yml).",
     )
+    pdf_parser.add_argument(
+        "--native-pdf",
+        action="store_true",
+        help=(
+            "Przekaż PDF bezpośrednio do silnika (tylko PaddleOCR). Pomija --dpi, "
+            "preprocessing i models.max_input_side."
+        ),
+    )
     add_common_args(pdf_parser)
 
     img_parser = subparsers.add_parser("images", help="Konwersja obrazów do tekstu")
@@ -65,12 +85,17 @@ def _build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _engine_settings(
+    config: OCRConfig, engine_name: str | None, languages: Sequence[str] | None
+) -> Tuple[str, List[str]]:
+    return (engine_name or config.default_engine).lower(), list(languages or config.default_languages)
+
+
 def _prepare_engine(config: OCRConfig, engine_name: str | None, languages: Sequence[str] | None) -> OcrEngine:
-    selected_engine = (engine_name or config.default_engine).lower()
-    selected_languages = list(languages or config.default_languages)
-    return OcrEngine(
-        engine_name=selected_engine,
-        languages=selected_languages,
+    selected_engine, selected_languages = _engine_settings(config, engine_name, languages)
+    return get_engine(
+        selected_engine,
+        selected_languages,
         tesseract_cmd=config.models.tesseract_cmd,
         model_config=config.models,
     )
@@ -87,30 +112,97 @@ def _export(pages: List[str], output_dir: Path, base_name: str, file_format: str
     return output_path
 
 
-def _run_on_images(images: Iterable[Image.Image], engine: OcrEngine, preprocess_options: dict) -> List[str]:
+def _batched(items: Iterable[Image.Image], size: int) -> Iterator[List[Image.Image]]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _run_on_images(
+    images: Iterable[Image.Image],
+    engine: OcrEngine,
+    preprocess_options: dict,
+    batch_size: int = 1,
+) -> List[str]:
+    """OCR images in batches while loading and preprocessing run in background threads."""
+
+    options = PreprocessOptions.from_mapping(preprocess_options)
+
+    def preprocess(image: Image.Image) -> Image.Image:
+        return preprocess_image(image, options)[0]
+
     pages: List[str] = []
-    for image in images:
-        processed, _ = preprocess_image(image, preprocess_options)
-        result = engine.run(processed)
-        pages.append(result.text)
+    for batch in _batched(run_staged(images, (preprocess,)), max(1, batch_size)):
+        pages.extend(result.text for result in engine.run_batch(batch))
     return pages
 
 
+_worker_engine: Optional[OcrEngine] = None
+_worker_preprocess_options = PreprocessOptions()
+
+
+def _init_image_worker(
+    engine_name: str,
+    languages: List[str],
+    tesseract_cmd: str,
+    model_config: ModelConfig,
+    preprocess_options: dict,
+) -> None:
+    """Build the OCR engine once per worker process."""
+
+    global _worker_engine, _worker_preprocess_options
+    _worker_engine = init_worker_engine(engine_name, languages, tesseract_cmd, model_config)
+    _worker_preprocess_options = PreprocessOptions.from_mapping(preprocess_options)
+
+
+def _ocr_image_file(path: Path) -> str:
+    """Open, preprocess and OCR one image inside a worker process."""
+
+    with Image.open(path) as image:
+        processed, _ = preprocess_image(image.convert("RGB"), _worker_preprocess_options)
+    return _worker_engine.run(processed).text
+
+
 def handle_pdf(args: argparse.Namespace, config: OCRConfig) -> Path:
     engine = _prepare_engine(config, args.engine, args.languages)
+    if args.native_pdf:
+        if engine.supports_document_processing():
+            if args.dpi:
+                logger.warning("--native-pdf: silnik renderuje strony sam, --dpi %d zostanie pominięte", args.dpi)
+            texts = [result.text for result in engine.run_document(args.pdf)]
+            return _export(texts, args.output_dir, args.pdf.stem, args.format)
+        logger.warning("--native-pdf: silnik %s nie obsługuje PDF bezpośrednio; renderuję strony", engine.engine_name)
+
     dpi = args.dpi or config.pdf_dpi
-    pages = [
-        image
-        for _, image in load_pdf_pages(args.pdf, dpi=dpi)
-    ]
-    texts = _run_on_images(pages, engine, config.preprocess_options)
+    workers = args.jobs or config.max_workers
+    pages = (image for _, image in load_pdf_pages_parallel(args.pdf, dpi=dpi, workers=workers))
+    texts = _run_on_images(pages, engine, config.preprocess_options, batch_size=config.max_workers)
     return _export(texts, args.output_dir, args.pdf.stem, args.format)
 
 
 def handle_images(args: argparse.Namespace, config: OCRConfig) -> Path:
-    engine = _prepare_engine(config, args.engine, args.languages)
-    loaded_images = [Image.open(path).convert("RGB") for path in args.images]
-    texts = _run_on_images(loaded_images, engine, config.preprocess_options)
+    jobs = args.jobs or config.max_workers
+    if jobs > 1 and len(args.images) > 1:
+        # Decoding, preprocessing and OCR all happen in the workers; each one
+        # takes chunks of paths so that uneven image sizes balance out.
+        selected_engine, selected_languages = _engine_settings(config, args.engine, args.languages)
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=_init_image_worker,
+            initargs=(
+                selected_engine,
+                selected_languages,
+                config.models.tesseract_cmd,
+                config.models,
+                dict(config.preprocess_options),
+            ),
+        ) as executor:
+            chunksize = max(1, len(args.images) // (jobs * 4))
+            texts = list(executor.map(_ocr_image_file, args.images, chunksize=chunksize))
+    else:
+        engine = _prepare_engine(config, args.engine, args.languages)
+        loaded_images = (Image.open(path).convert("RGB") for path in args.images)
+        texts = _run_on_images(loaded_images, engine, config.preprocess_options, batch_size=config.max_workers)
     base_name = "batch" if len(args.images) > 1 else args.images[0].stem
     return _export(texts, args.output_dir, base_name, args.format)
 
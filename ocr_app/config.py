@@ -1,24 +1,86 @@
 """Global configuration for the OCR application."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field, is_dataclass
+import functools
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field, fields, is_dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump whenever the sidecar layout or _normalize_schema output changes so stale caches are ignored.
+_CONFIG_CACHE_VERSION = 3
+
+_DEFAULT_PREPROCESS: Mapping[str, bool] = MappingProxyType(
+    {
+        "grayscale": True,
+        "denoise": True,
+        "threshold": True,
+        "deskew": True,
+        "scale_up": True,
+        "remove_background": False,
+    }
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    return frozenset(item.name for item in fields(cls))
+
 
 def _update_dataclass(instance, data: Dict) -> None:
-    """Recursively update a dataclass instance with values from a dict."""
+    """Recursively update a dataclass instance with values from a dict.
+
+    Keys that are not fields of the dataclass are ignored.
+    """
 
+    names = _field_names(type(instance))
+    attributes = instance.__dict__
     for key, value in data.items():
-        if not hasattr(instance, key):
+        if key not in names:
             continue
-        current_value = getattr(instance, key)
-        if is_dataclass(current_value) and isinstance(value, dict):
+        current_value = attributes[key]
+        if isinstance(value, dict) and is_dataclass(current_value):
             _update_dataclass(current_value, value)
         else:
-            setattr(instance, key, value)
+            attributes[key] = value
+
+
+def _missing(paths: Iterable[Optional[Path]]) -> List[Path]:
+    """Return configured paths that do not exist, keeping input order.
+
+    Siblings sharing a parent directory are checked with a single ``os.scandir``
+    of that parent instead of one ``stat`` per path.
+    """
+
+    candidates = [path for path in paths if path]
+    parents: Dict[Path, int] = {}
+    for path in candidates:
+        parents[path.parent] = parents.get(path.parent, 0) + 1
+
+    listings: Dict[Path, frozenset] = {}
+    missing = []
+    for path in candidates:
+        if parents[path.parent] < 2 or not path.name:
+            if not path.exists():
+                missing.append(path)
+            continue
+        if path.parent not in listings:
+            try:
+                with os.scandir(path.parent) as entries:
+                    listings[path.parent] = frozenset(entry.name for entry in entries)
+            except OSError:
+                listings[path.parent] = frozenset()
+        if path.name not in listings[path.parent]:
+            missing.append(path)
+    return missing
 
 
 @dataclass
@@ -42,7 +104,7 @@ class PaddleModelPaths:
     def missing_paths(self) -> List[Path]:
         """Return a list of model paths that do not yet exist."""
 
-        return [path for path in (self.det_model_dir, self.rec_model_dir, self.cls_model_dir) if path and not path.exists()]
+        return _missing((self.det_model_dir, self.rec_model_dir, self.cls_model_dir))
 
 
 @dataclass
@@ -62,18 +124,38 @@ class ModelConfig:
     """Aggregated model locations and behaviour when models are missing."""
 
     tesseract_cmd: str = ""
+    # Tesseract engine mode (0-3) and page segmentation mode (0-13); 3/3 are Tesseract's defaults.
+    tesseract_oem: int = 3
+    tesseract_psm: int = 3
+    # Longer-side limit for PaddleOCR/EasyOCR input pages (0 disables); boxes are mapped back.
+    max_input_side: int = 1600
+    # Compile EasyOCR's recognizer with torch.compile (PyTorch 2.x; slower first pages).
+    torch_compile: bool = False
     paddleocr: PaddleModelPaths = field(default_factory=PaddleModelPaths)
     easyocr: EasyOcrModelPath = field(default_factory=EasyOcrModelPath)
     auto_download_missing: bool = True
-
-    def missing_models(self) -> List[str]:
-        """Return human-readable descriptions of missing model locations."""
-
-        missing = []
-        for path in self.paddleocr.missing_paths():
-            missing.append(f"PaddleOCR model: {path}")
-        for path in self.easyocr.missing_paths():
-            missing.append(f"EasyOCR models: {path}")
+    # "auto" picks CUDA for PaddleOCR/EasyOCR when the installed build can use it.
+    device: str = "auto"
+    # "auto" keeps each backend's default weights; fp32/fp16/int8 request that precision.
+    precision: str = "auto"
+
+    def missing_models(
+        self,
+        paddle_missing: Optional[List[Path]] = None,
+        easy_missing: Optional[List[Path]] = None,
+    ) -> List[str]:
+        """Return human-readable descriptions of missing model locations.
+
+        Already computed ``missing_paths()`` results can be passed in to avoid
+        checking the filesystem again.
+        """
+
+        if paddle_missing is None:
+            paddle_missing = self.paddleocr.missing_paths()
+        if easy_missing is None:
+            easy_missing = self.easyocr.missing_paths()
+        missing = [f"PaddleOCR model: {path}" for path in paddle_missing]
+        missing.extend(f"EasyOCR models: {path}" for path in easy_missing)
         return missing
 
     def manual_instruction(self) -> str:
@@ -92,24 +174,20 @@ class OCRConfig:
     """Configuration options for OCR processing and application defaults."""
 
     models: ModelConfig = field(default_factory=ModelConfig)
-    available_languages: List[str] = field(default_factory=lambda: ["pol", "eng"])
-    default_languages: List[str] = field(default_factory=lambda: ["pol", "eng"])
+    available_languages: Tuple[str, ...] = ("pol", "eng")
+    default_languages: Tuple[str, ...] = ("pol", "eng")
     pdf_dpi: int = 300
     default_engine: str = "tesseract"
     max_workers: int = 4
     temp_dir: Path = Path("./tmp")
     log_file: Path = Path("./ocr_app.log")
     metrics_file: Path = Path("./metrics/ocr_metrics.csv")
-    preprocess_options: dict = field(
-        default_factory=lambda: {
-            "grayscale": True,
-            "denoise": True,
-            "threshold": True,
-            "deskew": True,
-            "scale_up": True,
-            "remove_background": False,
-        }
-    )
+    # Reuse OCR results for byte-identical inputs and settings (SQLite file in temp_dir).
+    result_cache: bool = False
+    # OCR document pages in persistent worker processes instead of threads.
+    page_processes: bool = False
+    # Read-only and shared between instances; copy with dict(...) before editing or pickling.
+    preprocess_options: Mapping[str, bool] = field(default_factory=lambda: _DEFAULT_PREPROCESS)
 
     def ensure_dirs(self) -> None:
         """Create required directories if they do not exist."""
@@ -124,43 +202,152 @@ class OCRConfig:
         import logging
 
         logger = logging.getLogger(__name__)
-        missing = self.models.missing_models()
-
-        if not missing:
+        paddle_missing = self.models.paddleocr.missing_paths()
+        easy_missing = self.models.easyocr.missing_paths()
+        if not paddle_missing and not easy_missing:
             return
 
         if self.models.auto_download_missing:
-            for path in self.models.easyocr.missing_paths():
+            for path in easy_missing:
                 path.mkdir(parents=True, exist_ok=True)
                 logger.info(
                     "Brak modeli EasyOCR pod %s. Utworzono katalog – biblioteka pobierze modele automatycznie.",
                     path,
                 )
-            if self.models.paddleocr.missing_paths():
+            if paddle_missing:
                 logger.info(
                     "Brak modeli PaddleOCR: %s. Ścieżki zostaną pominięte, a biblioteka pobierze modele domyślne.",
-                    ", ".join(str(p) for p in self.models.paddleocr.missing_paths()),
+                    ", ".join(str(p) for p in paddle_missing),
                 )
                 self.models.paddleocr = PaddleModelPaths()
         else:
             logger.warning(self.models.manual_instruction())
-            for item in missing:
+            for item in self.models.missing_models(paddle_missing, easy_missing):
                 logger.warning(" - %s", item)
 
 
 def load_config(config_path: Optional[Path | str] = None) -> OCRConfig:
-    """Load configuration from YAML, falling back to defaults when unavailable."""
+    """Load configuration from YAML, falling back to defaults when unavailable.
+
+    Results are cached per resolved path, so repeated calls return the same instance.
+    """
 
-    config = OCRConfig()
     path = Path(config_path) if config_path else Path(__file__).with_name("config.yml")
+    return _load_config_cached(path.resolve())
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(path: Path) -> OCRConfig:
+    config = OCRConfig()
     if path.exists():
-        loaded = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
-        _update_dataclass(config, _normalize_schema(loaded, source=str(path)))
+        # Stat before reading so an edit made while loading invalidates the sidecar.
+        stat = path.stat()
+        normalized = _read_config_cache(path, stat)
+        if normalized is None:
+            raw_bytes = path.read_bytes()
+            signature = _config_signature(raw_bytes)
+            normalized = _read_config_cache(path, stat, signature)
+            if normalized is None:
+                loaded = yaml.load(raw_bytes, Loader=_YamlLoader) or {}
+                normalized = _normalize_schema(loaded, source=str(path))
+                _write_config_cache(
+                    path,
+                    {
+                        "version": _CONFIG_CACHE_VERSION,
+                        "sig": signature,
+                        "mtime_ns": stat.st_mtime_ns,
+                        "size": stat.st_size,
+                        "normalized": normalized,
+                    },
+                )
+        _update_dataclass(config, normalized)
     config.ensure_dirs()
     config.prepare_models()
     return config
 
 
+def _config_cache_path(path: Path) -> Path:
+    return path.with_name(path.name + ".cache.json")
+
+
+def _json_default(value):
+    if isinstance(value, Path):
+        return str(value)
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Nieobsługiwany typ w konfiguracji: {type(value).__name__}")
+
+
+def _config_signature(raw_bytes: bytes) -> str:
+    return hashlib.blake2b(raw_bytes, digest_size=16).hexdigest()
+
+
+def _read_config_cache(path: Path, stat: os.stat_result, signature: Optional[str] = None) -> Optional[Dict]:
+    """Return normalized settings from the JSON sidecar when it is still valid.
+
+    Without ``signature`` the sidecar is valid when the YAML's ``stat`` has
+    exactly the mtime and size recorded in it. With ``signature`` (hash of the
+    current YAML bytes) it is valid when the stored hash matches, e.g. after
+    the YAML was touched but not edited; the recorded mtime and size are then
+    updated so the next load takes the cheap path. Either way schema
+    validation, including model path checks, is skipped.
+    """
+
+    try:
+        cached = json.loads(_config_cache_path(path).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("version") != _CONFIG_CACHE_VERSION:
+        return None
+    if signature is None:
+        if cached.get("mtime_ns") != stat.st_mtime_ns or cached.get("size") != stat.st_size:
+            return None
+    else:
+        if cached.get("sig") != signature:
+            return None
+        cached["mtime_ns"] = stat.st_mtime_ns
+        cached["size"] = stat.st_size
+        _write_config_cache(path, cached)
+    normalized = cached.get("normalized")
+    return _restore_types(normalized) if isinstance(normalized, dict) else None
+
+
+def _write_config_cache(path: Path, payload: Dict) -> None:
+    """Atomically store the sidecar ``payload`` next to the YAML; failures are ignored."""
+
+    cache_path = _config_cache_path(path)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(payload, default=_json_default), encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _restore_types(normalized: Dict) -> Dict:
+    """Convert JSON values back to the types produced by ``_normalize_schema``."""
+
+    models = normalized.get("models", {})
+    paddle = models.get("paddleocr", {})
+    for key, value in paddle.items():
+        paddle[key] = Path(value)
+    easyocr = models.get("easyocr", {})
+    if "model_dir" in easyocr:
+        easyocr["model_dir"] = Path(easyocr["model_dir"])
+    for key in ("temp_dir", "log_file"):
+        if key in normalized:
+            normalized[key] = Path(normalized[key])
+    for key in ("available_languages", "default_languages"):
+        if key in normalized:
+            normalized[key] = tuple(normalized[key])
+    if "preprocess_options" in normalized:
+        normalized["preprocess_options"] = MappingProxyType(normalized["preprocess_options"])
+    return normalized
+
+
 def _normalize_schema(raw: Dict, *, source: str) -> Dict:
     """Map YAML keys to dataclass fields with validation and clear errors."""
 
@@ -194,7 +381,18 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
     models_normalized: Dict = {}
     models_dict = _validate_dict(models_raw, "models") if models_raw else {}
     if models_dict is not None:
-        allowed_models = {"tesseract_cmd", "paddleocr", "easyocr", "auto_download_missing"}
+        allowed_models = {
+            "tesseract_cmd",
+            "tesseract_oem",
+            "tesseract_psm",
+            "max_input_side",
+            "torch_compile",
+            "paddleocr",
+            "easyocr",
+            "auto_download_missing",
+            "device",
+            "precision",
+        }
         for key in models_dict:
             if key not in allowed_models:
                 errors.append(f"Nieznany klucz models.{key} w {source}.")
@@ -213,6 +411,39 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
             else:
                 errors.append("models.tesseract_cmd musi być tekstem.")
 
+        for key, upper in (("tesseract_oem", 3), ("tesseract_psm", 13)):
+            if key in models_dict:
+                value = models_dict[key]
+                if isinstance(value, int) and not isinstance(value, bool) and 0 <= value <= upper:
+                    models_normalized[key] = value
+                else:
+                    errors.append(f"models.{key} musi być liczbą całkowitą z zakresu 0-{upper}.")
+
+        if "max_input_side" in models_dict:
+            value = models_dict["max_input_side"]
+            if isinstance(value, int) and not isinstance(value, bool) and value >= 0:
+                models_normalized["max_input_side"] = value
+            else:
+                errors.append("models.max_input_side musi być nieujemną liczbą całkowitą (0 wyłącza).")
+
+        if "torch_compile" in models_dict:
+            if isinstance(models_dict["torch_compile"], bool):
+                models_normalized["torch_compile"] = models_dict["torch_compile"]
+            else:
+                errors.append("models.torch_compile musi być wartością logiczną (true/false).")
+
+        if "device" in models_dict:
+            if models_dict["device"] in ("auto", "cpu", "cuda"):
+                models_normalized["device"] = models_dict["device"]
+            else:
+                errors.append("models.device musi mieć wartość auto, cpu lub cuda.")
+
+        if "precision" in models_dict:
+            if models_dict["precision"] in ("auto", "fp32", "fp16", "int8"):
+                models_normalized["precision"] = models_dict["precision"]
+            else:
+                errors.append("models.precision musi mieć wartość auto, fp32, fp16 lub int8.")
+
         if "paddleocr" in models_dict:
             paddle = _validate_dict(models_dict.get("paddleocr"), "models.paddleocr")
             if paddle is not None:
@@ -225,7 +456,7 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
                     if key in paddle:
                         path_value = _validate_path(paddle[key], f"models.paddleocr.{key}")
                         if path_value:
-                            if not path_value.exists() and auto_download is False:
+                            if auto_download is False and not path_value.exists():
                                 errors.append(
                                     f"Ścieżka {key} w sekcji models.paddleocr nie istnieje: {path_value}"
                                 )
@@ -243,7 +474,7 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
                 if "model_dir" in easyocr:
                     path_value = _validate_path(easyocr.get("model_dir"), "models.easyocr.model_dir")
                     if path_value:
-                        if not path_value.exists() and auto_download is False:
+                        if auto_download is False and not path_value.exists():
                             errors.append(
                                 f"Ścieżka models.easyocr.model_dir nie istnieje: {path_value}"
                             )
@@ -266,7 +497,7 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
                     if not isinstance(values, list) or not all(isinstance(val, str) for val in values):
                         errors.append(f"languages.{key} musi być listą stringów.")
                     else:
-                        normalized[target] = values
+                        normalized[target] = tuple(values)
 
     # PDF
     if "pdf" in raw:
@@ -288,7 +519,7 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
     if "app" in raw:
         app = _validate_dict(raw["app"], "app")
         if app is not None:
-            allowed_app = {"default_engine", "max_workers", "temp_dir", "log_file"}
+            allowed_app = {"default_engine", "max_workers", "temp_dir", "log_file", "result_cache", "page_processes"}
             for key in app:
                 if key not in allowed_app:
                     errors.append(f"Nieznany klucz app.{key} w {source}.")
@@ -313,6 +544,16 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
                 path_value = _validate_path(app["log_file"], "app.log_file")
                 if path_value is not None:
                     normalized.setdefault("log_file", path_value)
+            if "result_cache" in app:
+                if isinstance(app["result_cache"], bool):
+                    normalized["result_cache"] = app["result_cache"]
+                else:
+                    errors.append("app.result_cache musi być wartością logiczną (true/false).")
+            if "page_processes" in app:
+                if isinstance(app["page_processes"], bool):
+                    normalized["page_processes"] = app["page_processes"]
+                else:
+                    errors.append("app.page_processes musi być wartością logiczną (true/false).")
 
     # Preprocess
     if "preprocess" in raw:
@@ -325,13 +566,14 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
                 "deskew",
                 "scale_up",
                 "remove_background",
+                "use_opencl",
             }
             for key in preprocess:
                 if key not in allowed_preprocess:
                     errors.append(f"Nieznany klucz preprocess.{key} w {source}.")
                 elif not isinstance(preprocess[key], bool):
                     errors.append(f"preprocess.{key} musi być wartością logiczną (true/false).")
-            normalized.setdefault("preprocess_options", preprocess)
+            normalized.setdefault("preprocess_options", MappingProxyType(dict(preprocess)))
 
     if errors:
         raise ValueError("\n".join(errors))
@@ -339,4 +581,10 @@ def _normalize_schema(raw: Dict, *, source: str) -> Dict:
     return normalized
 
 
-config = load_config()
+def __getattr__(name: str):
+    """Load the default configuration on first access to ``config`` (PEP 562)."""
+
+    if name == "config":
+        globals()["config"] = load_config()
+        return globals()["config"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
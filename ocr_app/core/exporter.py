@@ -1,21 +1,69 @@
 """Export utilities for OCR results."""
 from __future__ import annotations
 
+import re
 from pathlib import Path
-from typing import List
+from typing import Iterable, List
 
 import docx
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 
+_RUN_BREAKS = re.compile(r"(\r\n|[\r\n\t])")
 
-def export_txt(output_path: Path, pages: List[str]) -> None:
-    """Save pages to a TXT file."""
-    output_path.write_text("\n\n".join(pages), encoding="utf-8")
+
+def export_txt(output_path: Path, pages: Iterable[str]) -> None:
+    """Save pages to a TXT file, streaming them instead of joining in memory."""
+    with output_path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        for idx, page in enumerate(pages):
+            if idx:
+                handle.write("\n\n")
+            handle.write(page)
+
+
+def _run(text: str):
+    """Build a ``<w:r>`` element, mapping tabs and line breaks like ``Run.text``."""
+    run = OxmlElement("w:r")
+    for chunk in _RUN_BREAKS.split(text):
+        if not chunk:
+            continue
+        if chunk == "\t":
+            run.append(OxmlElement("w:tab"))
+        elif chunk in ("\n", "\r", "\r\n"):
+            run.append(OxmlElement("w:br"))
+        else:
+            element = OxmlElement("w:t")
+            element.set(qn("xml:space"), "preserve")
+            element.text = chunk
+            run.append(element)
+    return run
+
+
+def _paragraph(text: str, style_id: str | None = None):
+    paragraph = OxmlElement("w:p")
+    if style_id:
+        properties = OxmlElement("w:pPr")
+        style = OxmlElement("w:pStyle")
+        style.set(qn("w:val"), style_id)
+        properties.append(style)
+        paragraph.append(properties)
+    if text:
+        paragraph.append(_run(text))
+    return paragraph
 
 
 def export_docx(output_path: Path, pages: List[str]) -> None:
-    """Save pages to a DOCX file."""
+    """Save pages to a DOCX file.
+
+    Paragraph XML is built directly and inserted before the section
+    properties, bypassing ``add_heading``/``add_paragraph`` which look up
+    styles and walk the body on every call.
+    """
     document = docx.Document()
+    # Resolve the style id once (it differs from the display name "Heading 2").
+    heading_style = document.styles["Heading 2"].style_id
+    section_properties = document.element.body.find(qn("w:sectPr"))
     for idx, page in enumerate(pages):
-        document.add_heading(f"Page {idx + 1}", level=2)
-        document.add_paragraph(page)
+        section_properties.addprevious(_paragraph(f"Page {idx + 1}", heading_style))
+        section_properties.addprevious(_paragraph(page))
     document.save(output_path)
@@ -2,9 +2,16 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Optional
-
+import os
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
 import pytesseract
 from pytesseract import Output
 from PIL import Image
@@ -35,8 +42,6 @@ def _safe_import_paddleocr():
     return PaddleOCR
 
 
-PaddleOCR = _safe_import_paddleocr()
-
 
 def _safe_import_easyocr():
     try:
@@ -56,7 +61,202 @@ def _safe_import_easyocr():
     return easyocr
 
 
-easyocr = _safe_import_easyocr()
+
+def _safe_import_tesserocr():
+    try:
+        import tesserocr
+    except ImportError:  # pragma: no cover - optional dependency
+        logger.info("tesserocr not installed; Tesseract will run through pytesseract.")
+        return None
+    except OSError as exc:  # pragma: no cover - optional dependency
+        logger.warning("tesserocr failed to load: %s", exc)
+        return None
+    return tesserocr
+
+
+_OPTIONAL_IMPORTERS = {
+    "paddleocr": _safe_import_paddleocr,
+    "easyocr": _safe_import_easyocr,
+    "tesserocr": _safe_import_tesserocr,
+}
+_optional_modules: Dict[str, object] = {}
+_optional_modules_lock = threading.Lock()
+
+
+def _cuda_available(backend: str) -> bool:
+    """Return True when the given backend's installed build can run on a CUDA device."""
+
+    try:
+        if backend == "paddleocr":
+            import paddle
+
+            return paddle.device.is_compiled_with_cuda() and paddle.device.cuda.device_count() > 0
+        import torch
+
+        return torch.cuda.is_available()
+    except Exception:  # pragma: no cover - depends on installed builds
+        return False
+
+
+def _use_gpu(device: str, backend: str) -> bool:
+    """Resolve ``ModelConfig.device`` ("auto", "cpu", "cuda") for one backend and log the choice."""
+
+    use_gpu = device == "cuda" or (device == "auto" and _cuda_available(backend))
+    logger.info("%s: running on %s.", backend, "cuda" if use_gpu else "cpu")
+    return use_gpu
+
+
+def _easyocr_quantize(precision: str, use_gpu: bool) -> bool:
+    """Map ``ModelConfig.precision`` to EasyOCR's ``quantize`` flag (dynamic int8, CPU only)."""
+
+    if precision == "fp16" and not use_gpu:
+        logger.warning("EasyOCR: fp16 precision requires a GPU; using fp32.")
+    elif precision == "int8" and use_gpu:
+        logger.warning("EasyOCR: int8 quantization only works on CPU; using fp32.")
+    return precision in ("auto", "int8")
+
+
+def _compile_recognizer(reader, use_gpu: bool) -> None:
+    """Replace EasyOCR's recognizer with a ``torch.compile`` version in place.
+
+    On CUDA the "reduce-overhead" mode replays CUDA graphs, which removes the
+    per-kernel launch cost that dominates the small per-line recognizer
+    inputs. Compilation happens lazily on the first recognized batch.
+    """
+
+    import torch
+
+    if not hasattr(torch, "compile"):
+        logger.warning("EasyOCR: torch.compile requires PyTorch 2.x; skipping compilation.")
+        return
+    mode = "reduce-overhead" if use_gpu else "default"
+    reader.recognizer = torch.compile(reader.recognizer, mode=mode)
+    logger.info("EasyOCR: recognizer compiled with torch.compile (mode %s).", mode)
+
+
+def _lazy_import(name: str):
+    """Import an optional backend on first use and remember the outcome.
+
+    PaddleOCR and EasyOCR pull in paddle/torch, which takes seconds, so they are
+    only imported when an engine that needs them is constructed. Returns None
+    when the backend is unavailable.
+    """
+
+    with _optional_modules_lock:
+        if name not in _optional_modules:
+            _optional_modules[name] = _OPTIONAL_IMPORTERS[name]()
+        return _optional_modules[name]
+
+# Column order of Tesseract's TSV output (same as pytesseract.image_to_data).
+_TSV_COLUMNS = (
+    "level",
+    "page_num",
+    "block_num",
+    "par_num",
+    "line_num",
+    "word_num",
+    "left",
+    "top",
+    "width",
+    "height",
+    "conf",
+    "text",
+)
+
+
+def _parse_tsv(tsv: str) -> Dict[str, List]:
+    """Parse headerless Tesseract TSV rows into the dict layout of ``Output.DICT``."""
+
+    width = len(_TSV_COLUMNS)
+    rows: List[List[str]] = []
+    append = rows.append
+    for row in tsv.splitlines():
+        values = row.split("\t", width - 1)
+        if len(values) == width - 1:
+            values.append("")
+        elif len(values) < width:
+            continue
+        append(values)
+    # Transpose once instead of appending every cell to a per-column list.
+    columns = zip(*rows) if rows else [()] * width
+    return {column: list(values) for column, values in zip(_TSV_COLUMNS, columns)}
+
+
+def _int_column(values=()) -> np.ndarray:
+    return np.asarray(values, dtype=np.int32).reshape(-1)
+
+
+def _float_column(values=()) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64).reshape(-1)
+
+
+@dataclass
+class BoxColumns:
+    """Bounding boxes of one page stored column-wise, one entry per word or line.
+
+    Engines fill a handful of arrays instead of two dicts per box; dicts are
+    built only when a result is serialized (:meth:`to_dicts`). Unknown
+    confidences are NaN.
+    """
+
+    texts: List[str] = field(default_factory=list)
+    x: np.ndarray = field(default_factory=_int_column)
+    y: np.ndarray = field(default_factory=_int_column)
+    width: np.ndarray = field(default_factory=_int_column)
+    height: np.ndarray = field(default_factory=_int_column)
+    confidence: np.ndarray = field(default_factory=_float_column)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def rows(self) -> Iterator[Tuple[str, int, int, int, int, Optional[float]]]:
+        """Yield ``(text, x, y, width, height, confidence)`` tuples of Python scalars."""
+
+        confidences = [None if conf != conf else conf for conf in self.confidence.tolist()]
+        return zip(
+            self.texts,
+            self.x.tolist(),
+            self.y.tolist(),
+            self.width.tolist(),
+            self.height.tolist(),
+            confidences,
+        )
+
+    def scaled(self, factor: float) -> "BoxColumns":
+        """Return boxes with coordinates multiplied by ``factor``, e.g. to undo a model-input resize."""
+
+        if factor == 1.0:
+            return self
+
+        def scale(column: np.ndarray) -> np.ndarray:
+            return np.rint(column * factor).astype(np.int32)
+
+        return replace(self, x=scale(self.x), y=scale(self.y), width=scale(self.width), height=scale(self.height))
+
+    def to_dicts(self) -> List[Dict[str, object]]:
+        """Return boxes in the ``{"text", "bbox", "confidence"}`` layout used for JSON output."""
+
+        return [
+            {"text": text, "bbox": {"x": x, "y": y, "width": width, "height": height}, "confidence": conf}
+            for text, x, y, width, height, conf in self.rows()
+        ]
+
+    @classmethod
+    def from_dicts(cls, boxes: Iterable[Dict[str, object]]) -> "BoxColumns":
+        """Build columns from dicts in the :meth:`to_dicts` layout."""
+
+        boxes = list(boxes)
+        bboxes = [box.get("bbox") or {} for box in boxes]
+        return cls(
+            texts=[box.get("text", "") for box in boxes],
+            x=_int_column([bbox.get("x", 0) for bbox in bboxes]),
+            y=_int_column([bbox.get("y", 0) for bbox in bboxes]),
+            width=_int_column([bbox.get("width", 0) for bbox in bboxes]),
+            height=_int_column([bbox.get("height", 0) for bbox in bboxes]),
+            confidence=_float_column(
+                [np.nan if box.get("confidence") is None else box["confidence"] for box in boxes]
+            ),
+        )
 
 
 @dataclass
@@ -65,28 +265,131 @@ class OcrResult:
 
     text: str
     confidence: Optional[float] = None
-    boxes: Optional[List[Dict[str, object]]] = None
+    boxes: BoxColumns = field(default_factory=BoxColumns)
+
+
+def _pack_line_keys(keys: np.ndarray) -> np.ndarray:
+    """Pack (page, block, paragraph, line) rows into one int64 per word.
+
+    Sorting a flat int64 column is much cheaper than ``np.unique(axis=0)`` on
+    rows. Each number gets 16 bits; rows that do not fit fall back to a dense
+    rank per column so the packed keys stay unique.
+    """
+
+    if keys.size and (keys.min() < 0 or keys.max() >= 1 << 16):
+        keys = np.column_stack([np.unique(column, return_inverse=True)[1].ravel() for column in keys.T])
+    keys = keys.astype(np.int64)
+    return (keys[:, 0] << 48) | (keys[:, 1] << 32) | (keys[:, 2] << 16) | keys[:, 3]
+
+
+# Text lines recognized per forward pass inside EasyOCR's readtext_batched.
+_EASYOCR_BATCH_SIZE = 8
+# Side of the blank page used to warm up GPU models after loading.
+_WARM_START_SIDE = 640
+
+
+def _group_by_size(arrays: Sequence[np.ndarray], tolerance: float = 0.2) -> List[List[int]]:
+    """Group array indices so that image sizes within a group differ by at most ``tolerance``."""
+
+    order = sorted(range(len(arrays)), key=lambda idx: arrays[idx].shape[:2])
+    groups: List[List[int]] = []
+    for idx in order:
+        height, width = arrays[idx].shape[:2]
+        if groups:
+            ref_height, ref_width = arrays[groups[-1][0]].shape[:2]
+            if abs(width - ref_width) <= tolerance * ref_width and abs(height - ref_height) <= tolerance * ref_height:
+                groups[-1].append(idx)
+                continue
+        groups.append([idx])
+    return groups
+
+
+def _to_array(image: Image.Image) -> np.ndarray:
+    """Return the pixels of a loaded image as a uint8 array (2-D for grayscale).
+
+    PaddleOCR and EasyOCR take ndarrays directly; RGB and L images are read
+    without a ``convert`` copy.
+    """
+
+    if image.mode not in ("L", "RGB"):
+        image = image.convert("RGB")
+    return np.asarray(image)
+
+
+def _fit_to_side(array: np.ndarray, max_side: int) -> Tuple[np.ndarray, float]:
+    """Downscale ``array`` so its longer side is at most ``max_side`` (0 disables).
+
+    Returns the array and the factor that maps coordinates on it back to the
+    original image.
+    """
+
+    height, width = array.shape[:2]
+    longest = max(height, width)
+    if not max_side or longest <= max_side:
+        return array, 1.0
+    factor = longest / max_side
+    size = (max(1, round(width / factor)), max(1, round(height / factor)))
+    return cv2.resize(array, size, interpolation=cv2.INTER_AREA), factor
+
+
+def _stack_padded(arrays: Sequence[np.ndarray]) -> np.ndarray:
+    """Stack RGB or grayscale arrays into a (B, H, W, 3) batch padded with white to the largest size."""
+
+    max_height = max(array.shape[0] for array in arrays)
+    max_width = max(array.shape[1] for array in arrays)
+    batch = np.full((len(arrays), max_height, max_width, 3), 255, dtype=np.uint8)
+    for slot, array in enumerate(arrays):
+        height, width = array.shape[:2]
+        batch[slot, :height, :width] = array if array.ndim == 3 else array[:, :, None]
+    return batch
+
+
+def _rescaled(result: OcrResult, factor: float) -> OcrResult:
+    """Map boxes found on a downscaled model input back to original image coordinates."""
+
+    if factor != 1.0:
+        result.boxes = result.boxes.scaled(factor)
+    return result
 
 
 class OcrEngine:
-    """Selectable OCR engine facade."""
+    """Selectable OCR engine facade.
+
+    PaddleOCR and EasyOCR models are not safe for concurrent inference, so calls
+    into them are serialized by a per-instance lock; shared instances from
+    :func:`get_engine` can therefore be used from several threads.
+    """
 
     def __init__(
         self,
         engine_name: str,
-        languages: List[str],
+        languages: Sequence[str],
         tesseract_cmd: str = "",
         model_config: Optional[ModelConfig] = None,
     ) -> None:
         self.engine_name = engine_name.lower()
-        self.languages = languages
+        self.languages = tuple(languages)
+        # Tesseract/PaddleOCR language spec, built once instead of per page.
+        self._lang_joined = "+".join(self.languages)
+        self._lock = threading.Lock()
+        self._tess_api = None
+        self._warmed_shapes: set = set()
+        self._fp16 = False
+        self._on_gpu = False
         config = model_config or ModelConfig()
         tesseract_path = tesseract_cmd or config.tesseract_cmd
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
+        self._max_side = config.max_input_side
+        self._tess_oem = config.tesseract_oem
+        self._tess_psm = config.tesseract_psm
+        self._tess_config = f"--oem {config.tesseract_oem} --psm {config.tesseract_psm}"
+
+        PaddleOCR = _lazy_import("paddleocr") if self.engine_name == "paddleocr" else None
+        easyocr = _lazy_import("easyocr") if self.engine_name == "easyocr" else None
 
         if self.engine_name == "paddleocr" and PaddleOCR:
-            paddle_kwargs: Dict[str, str] = {}
+            paddle_kwargs: Dict[str, object] = {}
             missing_paths = config.paddleocr.missing_paths()
             if missing_paths and not config.auto_download_missing:
                 message = (
@@ -102,7 +405,14 @@ class OcrEngine:
                     "Brak modeli PaddleOCR (%s). Używam domyślnego mechanizmu pobierania biblioteki.",
                     ", ".join(str(p) for p in missing_paths),
                 )
-            self.engine = PaddleOCR(lang="+".join(languages), **paddle_kwargs)
+            self._on_gpu = _use_gpu(config.device, "paddleocr")
+            if self._on_gpu:
+                paddle_kwargs.update(use_gpu=True, gpu_mem=500)
+            else:
+                paddle_kwargs["use_gpu"] = False
+            if config.precision != "auto":
+                paddle_kwargs["precision"] = config.precision
+            self.engine = PaddleOCR(lang=self._lang_joined, **paddle_kwargs)
         elif self.engine_name == "paddleocr" and not PaddleOCR:
             logger.warning(
                 "PaddleOCR unavailable. Ensure CPU build is installed and Visual C++ runtimes are present."
@@ -120,118 +430,342 @@ class OcrEngine:
             model_dir = config.easyocr.model_dir
             if model_dir:
                 model_dir.mkdir(parents=True, exist_ok=True)
+            use_gpu = _use_gpu(config.device, "easyocr")
             self.engine = easyocr.Reader(
-                languages,
+                list(languages),
                 model_storage_directory=str(model_dir) if model_dir else None,
                 download_enabled=config.auto_download_missing,
+                gpu=use_gpu,
+                quantize=_easyocr_quantize(config.precision, use_gpu),
+                cudnn_benchmark=True,
             )
+            self._on_gpu = use_gpu
+            self._fp16 = use_gpu and config.precision == "fp16"
+            if config.torch_compile:
+                _compile_recognizer(self.engine, use_gpu)
         elif self.engine_name == "easyocr" and not easyocr:
             logger.warning("EasyOCR unavailable. Install optional dependency 'easyocr'.")
             self.engine = None
         else:
             self.engine = None
 
+        if self.engine is not None and self._on_gpu:
+            self._warm_start()
+
+    def _warm_start(self) -> None:
+        """Run one blank inference right after a model is loaded on GPU.
+
+        CUDA context setup, memory pool growth and cuDNN autotuning then happen
+        when the engine is built (once per process with ``get_engine``) instead
+        of on the first real page.
+        """
+
+        shape = (_WARM_START_SIDE, _WARM_START_SIDE, 3)
+        if self.engine_name == "paddleocr":
+            self.engine.ocr(np.zeros(shape, dtype=np.uint8), cls=True)
+        else:
+            with self._inference_context():
+                self._warm_up((1, *shape))
+
     def run(self, image: Image.Image) -> OcrResult:
         """Execute OCR using the configured engine."""
         if self.engine_name == "tesseract":
             return self._run_tesseract(image)
         if self.engine_name == "paddleocr" and self.engine:
-            return self._run_paddleocr(image)
+            array, factor = self._model_input(image, bgr=True)
+            with self._lock:
+                return _rescaled(self._run_paddleocr(array), factor)
         if self.engine_name == "easyocr" and self.engine:
-            return self._run_easyocr(image)
+            array, factor = self._model_input(image)
+            with self._lock:
+                return _rescaled(self._run_easyocr(array), factor)
         raise ValueError(f"Unsupported or unavailable engine: {self.engine_name}")
 
+    def run_batch(self, images: Sequence[Image.Image]) -> List[OcrResult]:
+        """Execute OCR on several images, batching inference where the engine allows it.
+
+        EasyOCR receives padded batches of similarly sized images, PaddleOCR runs
+        the whole batch under one lock acquisition (its ``ocr()`` rejects image
+        lists when detection is enabled, but recognition batches the detected
+        lines internally), Tesseract calls run concurrently in threads (each one
+        is a separate subprocess) and other engines fall back to :meth:`run` per
+        image. Results follow input order.
+        """
+
+        if not images:
+            return []
+        if self.engine_name == "easyocr" and self.engine:
+            with self._lock:
+                return self._run_easyocr_batch(images)
+        if self.engine_name == "paddleocr" and self.engine:
+            inputs = [self._model_input(image, bgr=True) for image in images]
+            with self._lock:
+                return [_rescaled(self._run_paddleocr(array), factor) for array, factor in inputs]
+        if self.engine_name == "tesseract" and len(images) > 1 and self._tesserocr_api() is None:
+            with ThreadPoolExecutor(max_workers=min(len(images), os.cpu_count() or 1)) as executor:
+                return list(executor.map(self._run_tesseract, images))
+        return [self.run(image) for image in images]
+
+    def _model_input(self, image: Image.Image, bgr: bool = False) -> Tuple[np.ndarray, float]:
+        """Return the array fed to PaddleOCR/EasyOCR and the factor mapping its boxes back.
+
+        Large pages are downscaled to ``ModelConfig.max_input_side`` with
+        INTER_AREA; both models resize internally anyway, so this keeps the
+        big resize (and the tensor bytes) out of every framework call. ``bgr``
+        flips channels for PaddleOCR, which treats arrays like ``cv2.imread``
+        output.
+        """
+
+        array, factor = _fit_to_side(_to_array(image), self._max_side)
+        return (array[:, :, ::-1] if bgr and array.ndim == 3 else array), factor
+
+    def supports_batching(self) -> bool:
+        """Return True when :meth:`run_batch` does real batched inference (EasyOCR)."""
+
+        return self.engine_name == "easyocr" and self.engine is not None
+
+    def supports_document_processing(self) -> bool:
+        """Return True when the engine can read multi-page documents (PDF) directly."""
+
+        return self.engine_name == "paddleocr" and self.engine is not None
+
+    def run_document(self, path: Path) -> List[OcrResult]:
+        """OCR a whole document without rendering its pages first, one result per page.
+
+        Only available when :meth:`supports_document_processing` is True. The
+        engine renders pages itself, so the app's preprocessing and DPI settings
+        do not apply.
+        """
+
+        if not self.supports_document_processing():
+            raise ValueError(f"Engine {self.engine_name} cannot process documents directly")
+        with self._lock:
+            results = self.engine.ocr(str(path), cls=True)
+        return [self._paddleocr_result(page or []) for page in results or []]
+
+    def _tesserocr_api(self):
+        """Return the in-process Tesseract API, created on first use, or None.
+
+        The API keeps language data loaded between pages. When tesserocr is
+        missing or cannot initialize the languages, pytesseract is used instead.
+        """
+
+        if self._tess_api is False:
+            return None
+        if self._tess_api is None:
+            tesserocr = _lazy_import("tesserocr")
+            with self._lock:
+                if tesserocr is None:
+                    self._tess_api = False
+                    return None
+                if self._tess_api is None:
+                    try:
+                        self._tess_api = tesserocr.PyTessBaseAPI(
+                            lang=self._lang_joined, psm=self._tess_psm, oem=self._tess_oem
+                        )
+                    except RuntimeError as exc:
+                        logger.warning("tesserocr unavailable (%s); falling back to pytesseract.", exc)
+                        self._tess_api = False
+                        return None
+        return self._tess_api
+
+    def _tesseract_data(self, image: Image.Image) -> Dict[str, List]:
+        api = self._tesserocr_api()
+        if api is None:
+            return pytesseract.image_to_data(
+                image, lang=self._lang_joined, config=self._tess_config, output_type=Output.DICT
+            )
+        with self._lock:
+            api.SetImage(image)
+            return _parse_tsv(api.GetTSVText(0))
+
     def _run_tesseract(self, image: Image.Image) -> OcrResult:
         """Run Tesseract and return text with bounding boxes and confidence."""
 
-        data = pytesseract.image_to_data(image, lang="+".join(self.languages), output_type=Output.DICT)
-        boxes: List[Dict[str, object]] = []
-        confs: List[float] = []
-        lines: Dict[str, List[str]] = {}
+        return self._tesseract_result(self._tesseract_data(image))
 
-        for idx, text in enumerate(data.get("text", [])):
-            stripped = text.strip()
-            if not stripped:
-                continue
-            conf_value = float(data.get("conf", ["-1"])[idx])
-            if conf_value >= 0:
-                confs.append(conf_value)
-            box = {
-                "text": stripped,
-                "bbox": {
-                    "x": int(data.get("left", [0])[idx]),
-                    "y": int(data.get("top", [0])[idx]),
-                    "width": int(data.get("width", [0])[idx]),
-                    "height": int(data.get("height", [0])[idx]),
-                },
-                "confidence": conf_value if conf_value >= 0 else None,
-            }
-            boxes.append(box)
-
-            line_key = (
-                data.get("page_num", [0])[idx],
-                data.get("block_num", [0])[idx],
-                data.get("par_num", [0])[idx],
-                data.get("line_num", [0])[idx],
-            )
-            lines.setdefault(str(line_key), []).append(stripped)
+    @staticmethod
+    def _tesseract_result(data: Dict[str, List]) -> OcrResult:
+        """Build an OcrResult from ``image_to_data`` columns.
+
+        Columns are converted to arrays once and filtered with a mask of
+        non-empty words; words are grouped into lines by their
+        ``(page, block, paragraph, line)`` numbers in reading order.
+        """
+
+        stripped = [text.strip() for text in data.get("text", [])]
+        keep = np.flatnonzero(np.fromiter(map(bool, stripped), dtype=bool, count=len(stripped)))
+        if not keep.size:
+            return OcrResult(text="", confidence=None)
+
+        words = [stripped[idx] for idx in keep.tolist()]
+        confs = np.asarray(data["conf"], dtype=np.float64)[keep]
+        x, y, width, height = (_int_column(data[key])[keep] for key in ("left", "top", "width", "height"))
+        line_keys = np.column_stack(
+            [np.asarray(data[key], dtype=np.int64)[keep] for key in ("page_num", "block_num", "par_num", "line_num")]
+        )
+        _, first_index, line_of_word = np.unique(_pack_line_keys(line_keys), return_index=True, return_inverse=True)
 
-        text_lines = [" ".join(words) for words in lines.values()]
-        joined_text = "\n".join(text_lines)
-        avg_conf = sum(confs) / len(confs) if confs else None
+        boxes = BoxColumns(words, x, y, width, height, np.where(confs >= 0, confs, np.nan))
 
-        return OcrResult(text=joined_text, confidence=avg_conf, boxes=boxes)
+        lines: List[List[str]] = [[] for _ in range(len(first_index))]
+        for word, line in zip(words, line_of_word.ravel().tolist()):
+            lines[line].append(word)
+        text_lines = [" ".join(lines[line]) for line in np.argsort(first_index, kind="stable").tolist()]
 
-    def _run_paddleocr(self, image: Image.Image) -> OcrResult:
+        valid = confs[confs >= 0]
+        avg_conf = float(valid.mean()) if valid.size else None
+        return OcrResult(text="\n".join(text_lines), confidence=avg_conf, boxes=boxes)
+
+    def _run_paddleocr(self, image: np.ndarray) -> OcrResult:
         """Run PaddleOCR with bounding boxes."""
 
         results = self.engine.ocr(image, cls=True)
-        boxes: List[Dict[str, object]] = []
-        texts: List[str] = []
-        confs: List[float] = []
-
-        for page in results or []:
-            for line in page:
-                quad = line[0]
-                text, score = line[1]
-                bbox = self._quad_to_bbox(quad)
-                boxes.append({"text": text, "bbox": bbox, "confidence": float(score)})
-                texts.append(text)
-                confs.append(float(score))
+        return self._paddleocr_result(line for page in results or [] for line in page or [])
 
-        combined_text = "\n".join(texts)
-        avg_conf = sum(confs) / len(confs) if confs else None
-        return OcrResult(text=combined_text, confidence=avg_conf, boxes=boxes)
+    def _paddleocr_result(self, lines: Iterable) -> OcrResult:
+        """Build an OcrResult from PaddleOCR ``(quad, (text, score))`` lines."""
+
+        lines = list(lines)
+        return self._lines_result(
+            [line[0] for line in lines],
+            [line[1][0] for line in lines],
+            [line[1][1] for line in lines],
+        )
 
-    def _run_easyocr(self, image: Image.Image) -> OcrResult:
+    def _inference_context(self):
+        """Return the context EasyOCR inference runs in: CUDA autocast for fp16, otherwise a no-op.
+
+        EasyOCR feeds float32 tensors, so instead of converting the weights with
+        ``half()`` the convolutions run under autocast.
+        """
+
+        if not self._fp16:
+            return nullcontext()
+        import torch
+
+        return torch.autocast("cuda", dtype=torch.float16)
+
+    def _run_easyocr(self, image: np.ndarray) -> OcrResult:
         """Run EasyOCR with bounding boxes."""
 
-        lines = self.engine.readtext(image)
-        boxes: List[Dict[str, object]] = []
-        texts: List[str] = []
-        confs: List[float] = []
+        with self._inference_context():
+            return self._easyocr_result(self.engine.readtext(image))
+
+    def _run_easyocr_batch(self, images: Sequence[Image.Image]) -> List[OcrResult]:
+        """Run EasyOCR over size-grouped, padded batches of images."""
+
+        inputs = [self._model_input(image) for image in images]
+        arrays = [array for array, _ in inputs]
+        results: List[Optional[OcrResult]] = [None] * len(images)
+        for group in _group_by_size(arrays):
+            batch = _stack_padded([arrays[idx] for idx in group])
+            with self._inference_context():
+                self._warm_up(batch.shape)
+                batch_lines = self.engine.readtext_batched(batch, batch_size=_EASYOCR_BATCH_SIZE)
+            for idx, lines in zip(group, batch_lines):
+                results[idx] = _rescaled(self._easyocr_result(lines), inputs[idx][1])
+        return results  # type: ignore[return-value]
+
+    def _warm_up(self, shape: Tuple[int, ...]) -> None:
+        """Run one blank batch per new input shape on GPU so cuDNN autotuning is not paid on real pages."""
+
+        if getattr(self.engine, "device", "cpu") == "cpu" or shape in self._warmed_shapes:
+            return
+        self._warmed_shapes.add(shape)
+        self.engine.readtext_batched(np.zeros(shape, dtype=np.uint8), batch_size=_EASYOCR_BATCH_SIZE)
+
+    def _easyocr_result(self, lines) -> OcrResult:
+        """Build an OcrResult from EasyOCR ``(points, text, score)`` tuples."""
+
+        lines = list(lines)
+        return self._lines_result(
+            [line[0] for line in lines],
+            [line[1] for line in lines],
+            [line[2] for line in lines],
+        )
 
-        for bbox_points, text, score in lines:
-            bbox = self._quad_to_bbox(bbox_points)
-            boxes.append({"text": text, "bbox": bbox, "confidence": float(score)})
-            texts.append(text)
-            confs.append(float(score))
+    def _lines_result(self, quads: Sequence, texts: Sequence[str], scores: Sequence) -> OcrResult:
+        """Combine recognized lines into an OcrResult with one box per line."""
 
+        confs = _float_column(scores)
+        x, y, width, height = self._quads_to_bboxes(quads).T
+        boxes = BoxColumns(list(texts), x, y, width, height, confs)
         combined_text = "\n".join(texts)
-        avg_conf = sum(confs) / len(confs) if confs else None
+        avg_conf = float(confs.mean()) if confs.size else None
         return OcrResult(text=combined_text, confidence=avg_conf, boxes=boxes)
 
+    @classmethod
+    def _quads_to_bboxes(cls, quads: Sequence) -> np.ndarray:
+        """Convert quadrilaterals to an (N, 4) int32 array of ``(x, y, width, height)`` rows.
+
+        Uses a single (N, 4, 2) min/max reduction when all quads have the same shape.
+        """
+
+        if not len(quads):
+            return np.zeros((0, 4), dtype=np.int32)
+        try:
+            points = np.asarray(quads, dtype=np.float64)
+        except ValueError:  # ragged point lists
+            points = None
+        if points is None or points.ndim != 3 or points.shape[2] != 2:
+            return np.stack([cls._quad_to_bbox(quad) for quad in quads])
+        mins = points.min(axis=1)
+        # astype truncates toward zero, like int() on each coordinate.
+        return np.hstack([mins, points.max(axis=1) - mins]).astype(np.int32)
+
     @staticmethod
-    def _quad_to_bbox(points) -> Dict[str, int]:
-        """Convert quadrilateral coordinates to an (x, y, width, height) bounding box."""
-
-        xs = [p[0] for p in points]
-        ys = [p[1] for p in points]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
-        return {
-            "x": int(min_x),
-            "y": int(min_y),
-            "width": int(max_x - min_x),
-            "height": int(max_y - min_y),
-        }
+    def _quad_to_bbox(points) -> np.ndarray:
+        """Convert quadrilateral coordinates to an ``(x, y, width, height)`` int32 row."""
+
+        coords = np.asarray(points, dtype=np.float64)
+        low = coords.min(axis=0)
+        return np.concatenate([low, coords.max(axis=0) - low]).astype(np.int32)
+
+
+_ENGINE_CACHE_SIZE = 8
+_engine_cache: Dict[Tuple, Tuple[Optional[ModelConfig], OcrEngine]] = {}
+_engine_cache_lock = threading.Lock()
+# Per-key locks held while an engine is constructed, so only callers asking
+# for the same engine wait for it.
+_engine_build_locks: Dict[Tuple, threading.Lock] = {}
+
+
+def get_engine(
+    engine_name: str,
+    languages: Sequence[str],
+    tesseract_cmd: str = "",
+    model_config: Optional[ModelConfig] = None,
+) -> OcrEngine:
+    """Return a shared engine for the given settings, constructing it on first use.
+
+    PaddleOCR and EasyOCR load their weights when constructed, so reusing one
+    instance per ``(engine, languages, tesseract_cmd, model_config)`` avoids a
+    multi-second reload on every call. The model config is keyed by identity
+    and kept referenced by the cache. The oldest entry is dropped once
+    ``_ENGINE_CACHE_SIZE`` engines are cached. Construction happens outside
+    the global cache lock, so loading one backend does not block callers that
+    want a different, already cached engine.
+    """
+
+    key = (engine_name.lower(), tuple(languages), tesseract_cmd, id(model_config))
+    with _engine_cache_lock:
+        cached = _engine_cache.get(key)
+        if cached is not None:
+            return cached[1]
+        build_lock = _engine_build_locks.setdefault(key, threading.Lock())
+    with build_lock:
+        with _engine_cache_lock:
+            cached = _engine_cache.get(key)
+        if cached is not None:
+            return cached[1]
+        try:
+            engine = OcrEngine(engine_name, languages, tesseract_cmd, model_config=model_config)
+            with _engine_cache_lock:
+                if len(_engine_cache) >= _ENGINE_CACHE_SIZE:
+                    _engine_cache.pop(next(iter(_engine_cache)))
+                _engine_cache[key] = (model_config, engine)
+        finally:
+            with _engine_cache_lock:
+                _engine_build_locks.pop(key, None)
+    return engine
@@ -2,19 +2,29 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field, replace
 from io import BytesIO
+from itertools import islice
+from multiprocessing import shared_memory
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Iterable, List, Optional, Sequence
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
+import numpy as np
 from PIL import Image
 
-from ..config import config
+from ..config import ModelConfig, load_config
 from ..logging_utils import setup_logging
 from . import pdf_loader
-from .image_preprocess import preprocess_image
-from .worker import PageTask, process_page
+from .image_preprocess import ImageLike, preprocess_image
+from .ocr_engine import BoxColumns, OcrEngine, get_engine
+from .pipeline import run_staged
+from .result_cache import ResultCache, cache_key, file_chunks
+from .worker import PageTask, init_worker_engine, process_page, process_pages
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +33,7 @@ setup_logging()
 
 SUPPORTED_IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp"}
 SUPPORTED_DOC_SUFFIXES = SUPPORTED_IMAGE_SUFFIXES | {".pdf"}
+_SUPPORTED_DOC_SUFFIX_TUPLE = tuple(SUPPORTED_DOC_SUFFIXES)
 
 
 @dataclass
@@ -32,7 +43,28 @@ class PageOcrResult:
     page_index: int
     text: str
     confidence: Optional[float]
-    boxes: List[dict]
+    boxes: BoxColumns = field(default_factory=BoxColumns)
+
+    def to_dict(self) -> dict:
+        """Return the page as plain JSON-ready data, boxes as a list of dicts."""
+
+        return {
+            "page_index": self.page_index,
+            "text": self.text,
+            "confidence": self.confidence,
+            "boxes": self.boxes.to_dicts(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PageOcrResult":
+        """Inverse of :meth:`to_dict`."""
+
+        return cls(
+            page_index=data["page_index"],
+            text=data["text"],
+            confidence=data["confidence"],
+            boxes=BoxColumns.from_dicts(data.get("boxes") or ()),
+        )
 
 
 def gather_paths(inputs: Sequence[Path], recursive: bool = False) -> List[Path]:
@@ -44,14 +76,7 @@ def gather_paths(inputs: Sequence[Path], recursive: bool = False) -> List[Path]:
             logger.warning("Ścieżka nie istnieje: %s", path)
             continue
         if path.is_dir():
-            if recursive:
-                for candidate in path.rglob("*"):
-                    if candidate.suffix.lower() in SUPPORTED_DOC_SUFFIXES:
-                        collected.append(candidate)
-            else:
-                for candidate in path.iterdir():
-                    if candidate.suffix.lower() in SUPPORTED_DOC_SUFFIXES:
-                        collected.append(candidate)
+            collected.extend(_scan_directory(path, recursive))
         elif path.suffix.lower() in SUPPORTED_DOC_SUFFIXES:
             collected.append(path)
         else:
@@ -59,11 +84,77 @@ def gather_paths(inputs: Sequence[Path], recursive: bool = False) -> List[Path]:
     return collected
 
 
-def _iterate_images(path: Path, dpi: int) -> Iterable[tuple[int, Image.Image]]:
+def _scan_directory(root: Path, recursive: bool) -> Iterator[Path]:
+    """Yield supported files below ``root`` using ``os.scandir``.
+
+    ``DirEntry`` type checks reuse the information returned by ``readdir``, so
+    unlike ``Path.rglob`` + ``Path.is_file`` no extra ``stat`` call is made per entry.
+    """
+
+    pending = [os.fspath(root)]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif entry.name.lower().endswith(_SUPPORTED_DOC_SUFFIX_TUPLE) and entry.is_file():
+                        yield Path(entry.path)
+        except OSError as exc:
+            logger.warning("Nie można odczytać katalogu %s: %s", current, exc)
+
+
+def _iterate_images(path: Path, dpi: int) -> Iterable[tuple[int, ImageLike]]:
     if path.suffix.lower() == ".pdf":
-        yield from pdf_loader.load_pdf_pages(path, dpi=dpi)
+        # Pages stay as arrays over the pixmap samples; preprocessing reads them without a PIL copy.
+        yield from pdf_loader.load_pdf_pages(path, dpi=dpi, as_numpy=True)
     else:
-        yield 0, Image.open(path)
+        # Decode once and release the file handle; later stages read the loaded pixels.
+        with Image.open(path) as image:
+            image.load()
+        yield 0, image if image.mode in ("L", "RGB") else image.convert("RGB")
+
+
+def _cached_results(
+    chunks: Iterable[bytes],
+    params: dict,
+    compute: Callable[[], List[PageOcrResult]],
+) -> List[PageOcrResult]:
+    """Return results for identical input bytes and settings from the result cache.
+
+    Caching is enabled with ``app.result_cache``; the SQLite file lives in the
+    configured ``temp_dir``.
+    """
+
+    config = load_config()
+    if not config.result_cache:
+        return compute()
+    cache = ResultCache(config.temp_dir / "ocr_results.sqlite")
+    key = cache_key(chunks, **params)
+    cached = cache.get(key)
+    if cached is not None:
+        return [PageOcrResult.from_dict(page) for page in cached]
+    pages = compute()
+    cache.put(key, [page.to_dict() for page in pages])
+    return pages
+
+
+# Bump when a result-affecting setting is added outside ``ModelConfig``.
+_CACHE_KEY_VERSION = 2
+
+
+def _cache_params(engine_name: str, languages: Sequence[str], preprocess_opts, dpi: int, tesseract_cmd: str) -> dict:
+    return {
+        "version": _CACHE_KEY_VERSION,
+        "engine": engine_name.lower(),
+        "languages": list(languages),
+        "preprocess": dict(preprocess_opts),
+        "dpi": dpi,
+        "tesseract_cmd": tesseract_cmd,
+        "models": asdict(load_config().models),
+    }
 
 
 def run_ocr_on_path(
@@ -73,15 +164,61 @@ def run_ocr_on_path(
     preprocess_options: Optional[dict] = None,
     dpi: int = 300,
     tesseract_cmd: str = "",
+    page_workers: Optional[int] = None,
 ) -> List[PageOcrResult]:
-    """Process a file (image or PDF) and return per-page OCR results."""
+    """Process a file (image or PDF) and return per-page OCR results.
 
-    preprocess_opts = preprocess_options or config.preprocess_options
-    page_results: List[PageOcrResult] = []
+    With ``app.result_cache`` enabled, results are looked up by a hash of the
+    file contents and OCR settings before any page is rendered.
+    """
 
-    for page_index, image in _iterate_images(path, dpi=dpi):
+    preprocess_opts = preprocess_options or load_config().preprocess_options
+    return _cached_results(
+        file_chunks(path),
+        _cache_params(engine_name, languages, preprocess_opts, dpi, tesseract_cmd),
+        lambda: _ocr_pages(
+            path,
+            _iterate_images(path, dpi=dpi),
+            engine_name,
+            languages,
+            preprocess_opts,
+            tesseract_cmd,
+            page_workers,
+        ),
+    )
+
+
+def _ocr_pages(
+    source_file: Path,
+    images: Iterable[tuple[int, ImageLike]],
+    engine_name: str,
+    languages: List[str],
+    preprocess_opts,
+    tesseract_cmd: str,
+    page_workers: Optional[int],
+) -> List[PageOcrResult]:
+    """Run OCR over ``images`` rendered from ``source_file``.
+
+    Pages are rendered in a background thread into a bounded queue and
+    preprocessed and recognized concurrently in up to ``page_workers`` threads
+    (default: ``max_workers`` from the config); OpenCV and the OCR backends
+    release the GIL, and Tesseract runs as a subprocess. Only about three times
+    ``page_workers`` rendered pages are alive at once, however long the PDF.
+    With ``app.page_processes`` enabled, pages go to persistent worker
+    processes instead (see :func:`_run_in_processes`). Results keep page order.
+    """
+
+    config = load_config()
+    workers = max(1, page_workers or config.max_workers)
+    pages = run_staged(images, (), maxsize=workers)
+    if workers > 1 and config.page_processes:
+        return _run_in_processes(pages, engine_name, languages, preprocess_opts, tesseract_cmd, workers)
+
+    engine = get_engine(engine_name, languages, tesseract_cmd, model_config=load_config().models)
+
+    def process_one(page_index: int, image: ImageLike) -> PageOcrResult:
         task = PageTask(
-            source_file=path,
+            source_file=source_file,
             page_index=page_index,
             engine_name=engine_name,
             languages=languages,
@@ -89,18 +226,182 @@ def run_ocr_on_path(
             tesseract_cmd=tesseract_cmd,
         )
         processed, _ = preprocess_image(image, preprocess_opts)
-        result = process_page(image, task, preprocessed=processed)
-        page_results.append(
+        result = process_page(image, task, preprocessed=processed, engine=engine)
+        return PageOcrResult(
+            page_index=page_index,
+            text=result.text,
+            confidence=result.confidence,
+            boxes=result.boxes,
+        )
+
+    if engine.supports_batching():
+        task = PageTask(
+            source_file=source_file,
+            page_index=0,
+            engine_name=engine_name,
+            languages=languages,
+            preprocess_options=preprocess_opts,
+            tesseract_cmd=tesseract_cmd,
+        )
+        return _run_batched(pages, task, engine, workers)
+    if workers == 1:
+        return [process_one(page_index, image) for page_index, image in pages]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return _run_windowed(pages, lambda page_index, image: executor.submit(process_one, page_index, image), workers)
+
+
+def _run_windowed(
+    pages: Iterable[tuple[int, ImageLike]],
+    submit: Callable[[int, ImageLike], Future],
+    workers: int,
+) -> List[PageOcrResult]:
+    """Submit pages while keeping at most ``2 * workers`` in flight; collect results in order."""
+
+    page_results: List[PageOcrResult] = []
+    pending: Deque[Future] = deque()
+    for page_index, image in pages:
+        pending.append(submit(page_index, image))
+        if len(pending) >= 2 * workers:
+            page_results.append(pending.popleft().result())
+    while pending:
+        page_results.append(pending.popleft().result())
+    return page_results
+
+
+# Long-lived page worker processes, one pool per engine setup; see _run_in_processes.
+_page_pools: Dict[tuple, ProcessPoolExecutor] = {}
+_page_pools_lock = threading.Lock()
+# Set inside page worker processes by _init_page_worker.
+_page_engine: Optional[OcrEngine] = None
+
+
+def _init_page_worker(
+    engine_name: str, languages: List[str], tesseract_cmd: str, model_config: ModelConfig
+) -> None:
+    """Build the OCR engine once per page worker process."""
+
+    global _page_engine
+    _page_engine = init_worker_engine(engine_name, languages, tesseract_cmd, model_config)
+
+
+def _ocr_shared_page(
+    name: str, shape: Tuple[int, ...], page_index: int, preprocess_options: dict
+) -> PageOcrResult:
+    """Read a page from shared memory, preprocess it and OCR it with the worker's engine."""
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        image = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+    processed, _ = preprocess_image(image, preprocess_options)
+    result = _page_engine.run(processed)
+    return PageOcrResult(
+        page_index=page_index,
+        text=result.text,
+        confidence=result.confidence,
+        boxes=result.boxes,
+    )
+
+
+def _page_pool_key(
+    engine_name: str, languages: Sequence[str], tesseract_cmd: str, workers: int, model_config: ModelConfig
+) -> tuple:
+    # ModelConfig is not hashable; its repr covers every field, nested paths included.
+    return (engine_name.lower(), tuple(languages), tesseract_cmd, workers, repr(model_config))
+
+
+def _page_pool(
+    engine_name: str, languages: Sequence[str], tesseract_cmd: str, workers: int, model_config: ModelConfig
+) -> ProcessPoolExecutor:
+    key = _page_pool_key(engine_name, languages, tesseract_cmd, workers, model_config)
+    with _page_pools_lock:
+        pool = _page_pools.get(key)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_page_worker,
+                initargs=(engine_name, list(languages), tesseract_cmd, model_config),
+            )
+            _page_pools[key] = pool
+        return pool
+
+
+def _run_in_processes(
+    pages: Iterable[tuple[int, ImageLike]],
+    engine_name: str,
+    languages: List[str],
+    preprocess_opts,
+    tesseract_cmd: str,
+    workers: int,
+) -> List[PageOcrResult]:
+    """Preprocess and OCR pages in persistent worker processes.
+
+    Each worker builds its engine once and keeps it between documents, so
+    in-process backends (tesserocr, PaddleOCR on CPU) run in parallel without
+    sharing the GIL or the engine lock. Pixels travel through shared memory;
+    the block is released as soon as its page is done.
+    """
+
+    model_config = load_config().models
+    pool = _page_pool(engine_name, languages, tesseract_cmd, workers, model_config)
+    options = dict(preprocess_opts)
+
+    def submit(page_index: int, image: ImageLike) -> Future:
+        if isinstance(image, Image.Image) and image.mode not in ("L", "RGB"):
+            image = image.convert("RGB")
+        pixels = np.asarray(image, dtype=np.uint8)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, pixels.nbytes))
+        np.ndarray(pixels.shape, dtype=np.uint8, buffer=shm.buf)[...] = pixels
+        try:
+            future = pool.submit(_ocr_shared_page, shm.name, pixels.shape, page_index, options)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        def release(_: Future) -> None:
+            shm.close()
+            shm.unlink()
+
+        future.add_done_callback(release)
+        return future
+
+    try:
+        return _run_windowed(pages, submit, workers)
+    except BrokenProcessPool:
+        with _page_pools_lock:
+            _page_pools.pop(_page_pool_key(engine_name, languages, tesseract_cmd, workers, model_config), None)
+        raise
+
+
+def _run_batched(
+    pages: Iterable[tuple[int, ImageLike]],
+    task: PageTask,
+    engine: OcrEngine,
+    workers: int,
+) -> List[PageOcrResult]:
+    """Preprocess pages in chunks and send each chunk to the engine as one batch."""
+
+    page_results: List[PageOcrResult] = []
+    iterator = iter(pages)
+    while True:
+        chunk = list(islice(iterator, 2 * workers))
+        if not chunk:
+            return page_results
+        chunk_task = replace(task, page_index=chunk[0][0])
+        results = process_pages([image for _, image in chunk], chunk_task, engine=engine, max_workers=workers)
+        page_results.extend(
             PageOcrResult(
                 page_index=page_index,
                 text=result.text,
                 confidence=result.confidence,
-                boxes=result.boxes or [],
+                boxes=result.boxes,
             )
+            for (page_index, _), result in zip(chunk, results)
         )
 
-    return page_results
-
 
 def run_ocr_on_bytes(
     payload: bytes,
@@ -111,34 +412,53 @@ def run_ocr_on_bytes(
     dpi: int = 300,
     tesseract_cmd: str = "",
 ) -> List[PageOcrResult]:
-    """Handle OCR for uploaded content (image or PDF)."""
+    """Handle OCR for uploaded content (image or PDF).
+
+    PDF pages are rendered straight from ``payload`` and go through the same
+    page pipeline as :func:`run_ocr_on_path`.
+    """
 
     suffix = Path(filename).suffix.lower()
-    preprocess_opts = preprocess_options or config.preprocess_options
+    preprocess_opts = preprocess_options or load_config().preprocess_options
+    params = _cache_params(engine_name, languages, preprocess_opts, dpi, tesseract_cmd)
 
     if suffix == ".pdf":
-        with NamedTemporaryFile(suffix=".pdf", delete=True) as tmp:
-            tmp.write(payload)
-            tmp.flush()
-            return run_ocr_on_path(Path(tmp.name), engine_name, languages, preprocess_opts, dpi, tesseract_cmd)
-
-    image = Image.open(BytesIO(payload))
-    task = PageTask(
-        source_file=Path(filename or "upload"),
-        page_index=0,
-        engine_name=engine_name,
-        languages=languages,
-        preprocess_options=preprocess_opts,
-        tesseract_cmd=tesseract_cmd,
-    )
-    processed, _ = preprocess_image(image, preprocess_opts)
-    result = process_page(image, task, preprocessed=processed)
-    return [
-        PageOcrResult(
+        return _cached_results(
+            [payload],
+            params,
+            lambda: _ocr_pages(
+                Path(filename),
+                pdf_loader.load_pdf_pages_from_bytes(payload, dpi=dpi, as_numpy=True),
+                engine_name,
+                languages,
+                preprocess_opts,
+                tesseract_cmd,
+                None,
+            ),
+        )
+
+    def compute() -> List[PageOcrResult]:
+        with Image.open(BytesIO(payload)) as image:
+            image.load()
+        task = PageTask(
+            source_file=Path(filename or "upload"),
             page_index=0,
-            text=result.text,
-            confidence=result.confidence,
-            boxes=result.boxes or [],
+            engine_name=engine_name,
+            languages=languages,
+            preprocess_options=preprocess_opts,
+            tesseract_cmd=tesseract_cmd,
         )
-    ]
+        processed, _ = preprocess_image(image, preprocess_opts)
+        engine = get_engine(engine_name, languages, tesseract_cmd, model_config=load_config().models)
+        result = process_page(image, task, preprocessed=processed, engine=engine)
+        return [
+            PageOcrResult(
+                page_index=0,
+                text=result.text,
+                confidence=result.confidence,
+                boxes=result.boxes,
+            )
+        ]
+
+    return _cached_results([payload], params, compute)
 
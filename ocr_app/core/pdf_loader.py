@@ -1,12 +1,26 @@
 """Utilities to load PDF pages into images."""
 from __future__ import annotations
 
+import functools
 import importlib.util
+import mmap
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing import resource_tracker, shared_memory
 from pathlib import Path
-from typing import Generator, Tuple
+from typing import Generator, Optional, Tuple, Union
 
+import numpy as np
 from PIL import Image
 
+# Rendered page: a PIL image, or an (H, W, 3) RGB uint8 array with ``as_numpy=True``.
+PageImage = Union[Image.Image, np.ndarray]
+
+_PAGES_NODE_RE = re.compile(rb"/Type\s*/Pages(?![A-Za-z])")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+
 
 def _require_pymupdf():
     """Return the imported PyMuPDF module or raise a helpful ImportError."""
@@ -21,23 +35,162 @@ def _require_pymupdf():
     return fitz
 
 
-def load_pdf_pages(pdf_path: Path, dpi: int = 300) -> Generator[Tuple[int, Image.Image], None, None]:
-    """Yield pages from a PDF as PIL Images at the requested DPI."""
-
-    fitz = _require_pymupdf()
-    doc = fitz.open(pdf_path)
+def _render_pages(
+    fitz, doc, dpi: int, as_numpy: bool, gray: bool = False
+) -> Generator[Tuple[int, PageImage], None, None]:
     zoom = dpi / 72
     matrix = fitz.Matrix(zoom, zoom)
+    colorspace = fitz.csGRAY if gray else fitz.csRGB
+    mode = "L" if gray else "RGB"
     for page_index in range(len(doc)):
         page = doc.load_page(page_index)
-        pix = page.get_pixmap(matrix=matrix)
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        yield page_index, img
+        pix = page.get_pixmap(matrix=matrix, colorspace=colorspace)
+        if as_numpy:
+            # A read-only view over the samples buffer; no second copy into a PIL image.
+            shape = (pix.height, pix.width) if gray else (pix.height, pix.width, pix.n)
+            yield page_index, np.frombuffer(pix.samples, dtype=np.uint8).reshape(shape)
+        else:
+            yield page_index, Image.frombytes(mode, [pix.width, pix.height], pix.samples)
 
 
-def count_pages(pdf_path: Path) -> int:
-    """Return the number of pages in the PDF file."""
+def load_pdf_pages(
+    pdf_path: Path, dpi: int = 300, as_numpy: bool = False
+) -> Generator[Tuple[int, PageImage], None, None]:
+    """Yield pages from a PDF as PIL Images (or RGB arrays with ``as_numpy``) at the requested DPI."""
+
+    fitz = _require_pymupdf()
+    with fitz.open(pdf_path) as doc:
+        yield from _render_pages(fitz, doc, dpi, as_numpy)
+
+
+def load_pdf_pages_gray(pdf_path: Path, dpi: int = 300) -> Generator[Tuple[int, Image.Image], None, None]:
+    """Yield pages from a PDF as single-channel (``"L"``) PIL Images.
+
+    PyMuPDF renders straight to gray, so the pixmap is a third of the RGB size
+    and no color conversion is needed. Meant for detection-only passes; use
+    :func:`load_pdf_pages` where color is needed.
+    """
 
     fitz = _require_pymupdf()
     with fitz.open(pdf_path) as doc:
+        yield from _render_pages(fitz, doc, dpi, as_numpy=False, gray=True)
+
+
+def load_pdf_pages_from_bytes(
+    payload: bytes, dpi: int = 300, as_numpy: bool = False
+) -> Generator[Tuple[int, PageImage], None, None]:
+    """Yield pages of an in-memory PDF as PIL Images (or RGB arrays with ``as_numpy``).
+
+    PyMuPDF reads the document straight from ``payload``; nothing is written to disk.
+    """
+
+    fitz = _require_pymupdf()
+    with fitz.open(stream=payload, filetype="pdf") as doc:
+        yield from _render_pages(fitz, doc, dpi, as_numpy)
+
+
+def _render_page_shared(pdf_path: Path, page_index: int, dpi: int) -> Tuple[str, int, int]:
+    """Render a page into a new shared memory block and return ``(name, width, height)``.
+
+    The calling process owns the block afterwards and must unlink it.
+    """
+
+    fitz = _require_pymupdf()
+    zoom = dpi / 72
+    with fitz.open(pdf_path) as doc:
+        pix = doc.load_page(page_index).get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        samples = pix.samples
+        shm = shared_memory.SharedMemory(create=True, size=len(samples))
+        shm.buf[: len(samples)] = samples
+        # Hand ownership to the consumer so this worker's tracker does not unlink it.
+        resource_tracker.unregister(shm._name, "shared_memory")
+        shm.close()
+        return shm.name, pix.width, pix.height
+
+
+def _take_shared_page(name: str, width: int, height: int) -> Image.Image:
+    """Copy a rendered page out of shared memory and release the block."""
+
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        return Image.frombytes("RGB", (width, height), shm.buf[: width * height * 3])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def load_pdf_pages_parallel(
+    pdf_path: Path, dpi: int = 300, workers: int = 4
+) -> Generator[Tuple[int, Image.Image], None, None]:
+    """Yield PDF pages in order while up to ``workers`` processes render ahead.
+
+    PyMuPDF is not thread-safe, so pages are rendered in separate processes.
+    Pixels come back through shared memory rather than being pickled through
+    the pool's pipe. At most ``2 * workers`` pages are rendered but not yet
+    consumed, which also caps the shared memory in use.
+    """
+
+    if workers <= 1:
+        yield from load_pdf_pages(pdf_path, dpi=dpi)
+        return
+
+    total = count_pages(pdf_path)
+    window = 2 * workers
+    pending: deque = deque()
+    next_index = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            while next_index < total or pending:
+                while next_index < total and len(pending) < window:
+                    future = executor.submit(_render_page_shared, pdf_path, next_index, dpi)
+                    pending.append((next_index, future))
+                    next_index += 1
+                page_index, future = pending.popleft()
+                yield page_index, _take_shared_page(*future.result())
+        finally:
+            # Release blocks rendered ahead when the consumer stops early.
+            for _, future in pending:
+                if not future.cancel() and future.exception() is None:
+                    _take_shared_page(*future.result())
+
+
+def _scan_page_count(pdf_path: Path) -> Optional[int]:
+    """Read the page count from the raw bytes of a simple PDF, or return ``None``.
+
+    Only trusted when the file has a single revision, no object streams, one
+    ``/Pages`` node and one ``/Count`` entry; anything else (incremental
+    updates, nested page trees, outlines, compressed objects) returns ``None``.
+    """
+
+    try:
+        with pdf_path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data.find(b"%%EOF") != data.rfind(b"%%EOF") or data.find(b"/ObjStm") != -1:
+                return None
+            if len(list(islice(_PAGES_NODE_RE.finditer(data), 2))) != 1:
+                return None
+            counts = list(islice(_COUNT_RE.finditer(data), 2))
+            return int(counts[0].group(1)) if len(counts) == 1 else None
+    except (OSError, ValueError):  # ValueError: mmap of an empty file
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _count_pages_cached(path: str, mtime_ns: int, size: int) -> int:
+    count = _scan_page_count(Path(path))
+    if count is not None:
+        return count
+    fitz = _require_pymupdf()
+    with fitz.open(path) as doc:
         return len(doc)
+
+
+def count_pages(pdf_path: Path) -> int:
+    """Return the number of pages in the PDF file.
+
+    Simple files are counted from their ``/Pages`` node without a full parse;
+    other files are opened with PyMuPDF. Results are memoized per path,
+    modification time and size.
+    """
+
+    stat = Path(pdf_path).stat()
+    return _count_pages_cached(str(pdf_path), stat.st_mtime_ns, stat.st_size)
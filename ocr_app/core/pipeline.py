@@ -0,0 +1,115 @@
+"""Bounded producer/consumer helpers for overlapping pipeline stages."""
+from __future__ import annotations
+
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Iterable, Iterator, List, Sequence
+
+_DONE = object()
+_POLL_INTERVAL = 0.1
+
+
+class _StageError:
+    """Wrapper carrying an exception raised inside a stage thread."""
+
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+def _put(target: Queue, item: Any, stop: threading.Event) -> bool:
+    """Put ``item`` into ``target`` unless ``stop`` is set while the queue is full."""
+
+    while not stop.is_set():
+        try:
+            target.put(item, timeout=_POLL_INTERVAL)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _pump(
+    source: Iterable[Any],
+    target: Queue,
+    transform: Callable[[Any], Any] | None,
+    stop: threading.Event,
+) -> None:
+    iterator = iter(source)
+    try:
+        for item in iterator:
+            if stop.is_set():
+                return
+            if isinstance(item, _StageError):
+                _put(target, item, stop)
+                return
+            if not _put(target, transform(item) if transform else item, stop):
+                return
+    except BaseException as exc:  # propagate to the consumer thread
+        _put(target, _StageError(exc), stop)
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+        _put(target, _DONE, stop)
+
+
+def _drain(queue: Queue, stop: threading.Event | None = None) -> Iterator[Any]:
+    while True:
+        try:
+            item = queue.get(timeout=_POLL_INTERVAL)
+        except Empty:
+            if stop is not None and stop.is_set():
+                return
+            continue
+        if item is _DONE:
+            return
+        yield item
+
+
+def _discard(queue: Queue) -> None:
+    while True:
+        try:
+            queue.get_nowait()
+        except Empty:
+            return
+
+
+def run_staged(
+    items: Iterable[Any],
+    stages: Sequence[Callable[[Any], Any]],
+    maxsize: int = 4,
+) -> Iterator[Any]:
+    """Yield ``items`` passed through ``stages``, each stage running in its own thread.
+
+    Reading ``items`` happens in a dedicated thread as well, so with stages
+    ``(preprocess, recognize)`` page N can be rendered while page N-1 is
+    preprocessed and page N-2 is recognized. Queues between stages are bounded
+    by ``maxsize`` which caps the number of pages held in memory. Output order
+    matches input order; an exception raised by any stage is re-raised here.
+    Closing the returned generator early stops the worker threads and closes
+    ``items`` if it is a generator.
+    """
+
+    stop = threading.Event()
+    queues: List[Queue] = [Queue(maxsize=maxsize) for _ in range(len(stages) + 1)]
+    workers = [threading.Thread(target=_pump, args=(items, queues[0], None, stop), daemon=True)]
+    for index, stage in enumerate(stages):
+        workers.append(
+            threading.Thread(
+                target=_pump,
+                args=(_drain(queues[index], stop), queues[index + 1], stage, stop),
+                daemon=True,
+            )
+        )
+    for worker in workers:
+        worker.start()
+
+    try:
+        for item in _drain(queues[-1]):
+            if isinstance(item, _StageError):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        for queue in queues:
+            _discard(queue)
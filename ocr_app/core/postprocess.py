@@ -6,8 +6,8 @@ from typing import List
 
 def clean_text(lines: List[str]) -> str:
     """Strip whitespace and remove empty lines."""
-    cleaned = [line.strip() for line in lines if line.strip()]
-    return "\n".join(cleaned)
+    stripped = (line.strip() for line in lines)
+    return "\n".join(line for line in stripped if line)
 
 
 def merge_pages(pages: List[str]) -> str:
@@ -0,0 +1,81 @@
+"""Content-addressed cache of OCR results stored in SQLite."""
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+
+
+def file_chunks(path: Path) -> Iterator[bytes]:
+    """Yield the file contents in 1 MiB chunks."""
+
+    with path.open("rb") as handle:
+        while chunk := handle.read(_CHUNK_SIZE):
+            yield chunk
+
+
+def cache_key(chunks: Iterable[bytes], **params) -> str:
+    """Return a blake2b digest of the input bytes and the OCR parameters.
+
+    Parameter values orjson cannot serialize natively (e.g. paths) are hashed
+    by their ``str()``.
+    """
+
+    digest = hashlib.blake2b(digest_size=20)
+    for chunk in chunks:
+        digest.update(chunk)
+    digest.update(orjson.dumps(params, default=str, option=orjson.OPT_SORT_KEYS))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Maps cache keys to serialized page results.
+
+    A connection is opened per operation, so one instance can be shared by
+    threads and several processes can use the same file. Storage errors are
+    logged and treated as cache misses.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, pages BLOB NOT NULL)")
+        return connection
+
+    def get(self, key: str) -> Optional[List[dict]]:
+        try:
+            connection = self._connect()
+            try:
+                row = connection.execute("SELECT pages FROM results WHERE key = ?", (key,)).fetchone()
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Nie można odczytać cache wyników OCR %s: %s", self.path, exc)
+            return None
+        return orjson.loads(row[0]) if row else None
+
+    def put(self, key: str, pages: List[dict]) -> None:
+        try:
+            connection = self._connect()
+            try:
+                with connection:
+                    connection.execute(
+                        "INSERT OR REPLACE INTO results (key, pages) VALUES (?, ?)",
+                        (key, orjson.dumps(pages, option=orjson.OPT_SERIALIZE_NUMPY)),
+                    )
+            finally:
+                connection.close()
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Nie można zapisać cache wyników OCR %s: %s", self.path, exc)
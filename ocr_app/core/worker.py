@@ -3,13 +3,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence
 
+import cv2
 from PIL import Image
 
 from ..config import ModelConfig
-from .image_preprocess import preprocess_image
-from .ocr_engine import OcrEngine, OcrResult
+from .image_preprocess import ImageLike, preprocess_image, preprocess_pages
+from .ocr_engine import OcrEngine, OcrResult, get_engine
 
 
 @dataclass
@@ -25,13 +26,60 @@ class PageTask:
     model_config: Optional[ModelConfig] = None
 
 
-def process_page(image: Image.Image, task: PageTask, preprocessed: Optional[Image.Image] = None) -> OcrResult:
-    """Process one page: preprocess (if needed) then run OCR."""
+def init_worker_engine(
+    engine_name: str, languages: Sequence[str], tesseract_cmd: str, model_config: Optional[ModelConfig]
+) -> OcrEngine:
+    """Prepare a pool worker process and return its shared OCR engine.
+
+    OpenCV is limited to one thread per worker; the pool already uses every core.
+    """
+
+    cv2.setNumThreads(1)
+    return get_engine(engine_name, languages, tesseract_cmd, model_config=model_config)
+
+
+def process_page(
+    image: ImageLike,
+    task: PageTask,
+    preprocessed: Optional[Image.Image] = None,
+    engine: Optional[OcrEngine] = None,
+) -> OcrResult:
+    """Process one page: preprocess (if needed) then run OCR.
+
+    Pass ``engine`` to use a specific engine; otherwise the shared engine for
+    the task settings is taken from :func:`get_engine`, so models are loaded
+    once rather than per page.
+    """
     processed = preprocessed or preprocess_image(image, task.preprocess_options)[0]
-    engine = OcrEngine(
-        task.engine_name,
-        task.languages,
-        task.tesseract_cmd,
-        model_config=task.model_config,
-    )
+    if engine is None:
+        engine = get_engine(
+            task.engine_name,
+            task.languages,
+            task.tesseract_cmd,
+            model_config=task.model_config,
+        )
     return engine.run(processed)
+
+
+def process_pages(
+    images: Sequence[ImageLike],
+    task: PageTask,
+    engine: Optional[OcrEngine] = None,
+    max_workers: Optional[int] = None,
+) -> List[OcrResult]:
+    """Process consecutive pages: preprocess them concurrently, then OCR them as one batch.
+
+    ``task.page_index`` is the index of the first image. Preprocessing runs in
+    up to ``max_workers`` threads (see :func:`preprocess_pages`) and the
+    results go to :meth:`OcrEngine.run_batch`, which batches inference for
+    EasyOCR and PaddleOCR. Results follow input order.
+    """
+    processed = preprocess_pages(images, task.preprocess_options, max_workers=max_workers)
+    if engine is None:
+        engine = get_engine(
+            task.engine_name,
+            task.languages,
+            task.tesseract_cmd,
+            model_config=task.model_config,
+        )
+    return engine.run_batch([image for image, _ in processed])
@@ -1,8 +1,10 @@
 """Text region detection helpers."""
 from __future__ import annotations
 
+import functools
 import logging
-from typing import Iterable, List, Sequence, Tuple
+from contextlib import nullcontext
+from typing import Iterable, List, Sequence, Tuple, Union
 
 import cv2
 import numpy as np
@@ -13,7 +15,9 @@ logger = logging.getLogger(__name__)
 BoundingBox = Tuple[int, int, int, int]
 
 
+@functools.lru_cache(maxsize=1)
 def _safe_import_easyocr():
+    """Import EasyOCR on first detection call (it loads torch); None when unavailable."""
     try:  # pragma: no cover - optional dependency
         import easyocr
     except (ImportError, OSError) as exc:  # pragma: no cover - optional dependency
@@ -22,11 +26,128 @@ def _safe_import_easyocr():
     return easyocr
 
 
-easyocr = _safe_import_easyocr()
+# Two iterations of a 5x3 rect dilation equal one 9x5 rect, which is separable
+# into a horizontal and a vertical pass (O(9 + 5) instead of O(2 * 15) per pixel).
+_DILATE_ROW = cv2.getStructuringElement(cv2.MORPH_RECT, (9, 1))
+_DILATE_COLUMN = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 5))
 
+# Pages stacked into one EasyOCR detect() call.
+_DETECT_BATCH_SIZE = 16
 
-def _to_array(image: Image.Image) -> np.ndarray:
-    return np.array(image)
+# Below this many boxes a Python sort beats building an array for np.lexsort.
+_LEXSORT_MIN_BOXES = 32
+
+# Side of the blank pages used to warm up a freshly loaded detector on GPU.
+_WARMUP_SIDE = 640
+
+
+@functools.lru_cache(maxsize=4)
+def _get_reader(languages: Tuple[str, ...]):
+    """Return a cached EasyOCR reader for ``languages``; loading the models takes seconds.
+
+    On GPU the new reader detects on one blank full-size batch, so CUDA context
+    setup and cuDNN algorithm selection happen here rather than on the first
+    real pages.
+    """
+
+    reader = _safe_import_easyocr().Reader(list(languages), cudnn_benchmark=True)
+    if getattr(reader, "device", "cpu") != "cpu":
+        _detect_stack(reader, np.full((_DETECT_BATCH_SIZE, _WARMUP_SIDE, _WARMUP_SIDE, 3), 255, dtype=np.uint8))
+    return reader
+
+
+def _detect_stack(reader, batch: np.ndarray):
+    """Run EasyOCR's detector on an (N, H, W, 3) RGB stack.
+
+    ``Reader.detect`` cannot reformat 4-D input, so the stack is passed as is
+    (``reformat=False``), the way ``readtext_batched`` does; CRAFT takes RGB.
+    """
+
+    return reader.detect(batch, min_size=8, reformat=False)
+
+
+def _detect_context(reader, precision: str):
+    """Return CUDA autocast for fp16 detection on GPU, otherwise a no-op context.
+
+    CRAFT is convolution-only, so fp16 runs on tensor cores and halves the
+    activation traffic; EasyOCR feeds float32 tensors, hence autocast rather
+    than converting the weights.
+    """
+
+    if precision != "fp16" or getattr(reader, "device", "cpu") == "cpu":
+        return nullcontext()
+    import torch
+
+    return torch.autocast("cuda", dtype=torch.float16)
+
+
+def _stack_padded(images: Sequence[Image.Image]) -> np.ndarray:
+    """Stack images into an (N, H, W, 3) uint8 batch, padding right/bottom with white.
+
+    Images keep their top-left origin, so detected coordinates need no mapping back.
+    """
+
+    height = max(image.height for image in images)
+    width = max(image.width for image in images)
+    batch = np.full((len(images), height, width, 3), 255, dtype=np.uint8)
+    for slot, image in enumerate(images):
+        if image.mode == "L":
+            # Broadcast the single channel into all three instead of converting to RGB first.
+            batch[slot, : image.height, : image.width] = np.asarray(image)[:, :, None]
+            continue
+        rgb = image if image.mode == "RGB" else image.convert("RGB")
+        batch[slot, : image.height, : image.width] = np.asarray(rgb)
+    return batch
+
+
+def _easyocr_boxes(horizontal: Iterable, free: Iterable, image: Image.Image) -> List[BoundingBox]:
+    """Convert one image's EasyOCR detections to ``(x1, y1, x2, y2)`` boxes clipped to the image.
+
+    Horizontal boxes arrive as ``[x_min, x_max, y_min, y_max]`` and free-form
+    ones as 4-point polygons; both are reduced with array operations rather
+    than per-point Python loops.
+    """
+
+    boxes = np.asarray(horizontal, dtype=np.float64).reshape(-1, 4)[:, [0, 2, 1, 3]]
+    polygons = np.asarray(free, dtype=np.float64).reshape(-1, 4, 2)
+    if len(polygons):
+        boxes = np.vstack([boxes, np.hstack([polygons.min(axis=1), polygons.max(axis=1)])])
+    # astype truncates toward zero, like int().
+    boxes = boxes.astype(np.int64)
+    np.maximum(boxes[:, :2], 0, out=boxes[:, :2])
+    np.minimum(boxes[:, 2:], (image.width, image.height), out=boxes[:, 2:])
+    return _sort_boxes(boxes)
+
+
+def detect_text_regions_batched(
+    images: Sequence[Image.Image],
+    detector: str = "easyocr",
+    languages: Sequence[str] | None = None,
+    min_area: int = 300,
+    precision: str = "auto",
+) -> List[List[BoundingBox]]:
+    """Detect text regions on several images, returning one box list per image.
+
+    With EasyOCR, images are padded to a common size and sent through the
+    detector in stacks of up to ``_DETECT_BATCH_SIZE`` using one cached reader
+    per language set; ``precision="fp16"`` (``models.precision``) runs the
+    detector under CUDA autocast. Without EasyOCR every image goes through
+    contour detection.
+    """
+
+    easyocr = _safe_import_easyocr() if detector.lower() == "easyocr" else None
+    if not easyocr:
+        return [_detect_via_contours(image, min_area=min_area) for image in images]
+
+    reader = _get_reader(tuple(languages or ("en",)))
+    results: List[List[BoundingBox]] = []
+    for start in range(0, len(images), _DETECT_BATCH_SIZE):
+        chunk = images[start : start + _DETECT_BATCH_SIZE]
+        with _detect_context(reader, precision):
+            horizontal, free = _detect_stack(reader, _stack_padded(chunk))
+        for image_horizontal, image_free, image in zip(horizontal, free, chunk):
+            results.append(_easyocr_boxes(image_horizontal, image_free, image))
+    return results
 
 
 def detect_text_regions(
@@ -34,6 +155,7 @@ def detect_text_regions(
     detector: str = "easyocr",
     languages: Sequence[str] | None = None,
     min_area: int = 300,
+    precision: str = "auto",
 ) -> List[BoundingBox]:
     """Detect text regions using EasyOCR detector when available.
 
@@ -41,27 +163,22 @@ def detect_text_regions(
     present, ensuring the pipeline still returns reasonable bounding boxes.
     """
 
-    if detector.lower() == "easyocr" and easyocr:
-        reader = easyocr.Reader(list(languages or ["en"]))
-        boxes, _ = reader.detect(_to_array(image), min_size=8)
-        flattened = []
-        for box_group in boxes:
-            for box in box_group:
-                xs = [pt[0] for pt in box]
-                ys = [pt[1] for pt in box]
-                flattened.append((int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))))
-        return _sort_boxes(flattened)
-
-    return _detect_via_contours(image, min_area=min_area)
+    return detect_text_regions_batched([image], detector, languages, min_area, precision)[0]
 
 
 def _detect_via_contours(image: Image.Image, min_area: int = 300) -> List[BoundingBox]:
-    """Simple contour-based text region proposal using morphology."""
+    """Simple contour-based text region proposal using morphology.
 
-    gray = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2GRAY)
+    Grayscale (``"L"``) images, e.g. from :func:`load_pdf_pages_gray`, are used as is.
+    """
+
+    if image.mode == "L":
+        gray = np.asarray(image)
+    else:
+        rgb = image if image.mode == "RGB" else image.convert("RGB")
+        gray = cv2.cvtColor(np.asarray(rgb), cv2.COLOR_RGB2GRAY)
     _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 3))
-    morphed = cv2.dilate(binary, kernel, iterations=2)
+    morphed = cv2.dilate(cv2.dilate(binary, _DILATE_ROW), _DILATE_COLUMN)
     contours, _ = cv2.findContours(morphed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
     boxes: List[BoundingBox] = []
@@ -73,8 +190,20 @@ def _detect_via_contours(image: Image.Image, min_area: int = 300) -> List[Boundi
     return _sort_boxes(boxes)
 
 
-def _sort_boxes(boxes: Iterable[BoundingBox]) -> List[BoundingBox]:
-    return sorted(boxes, key=lambda box: (box[1], box[0]))
+def _sort_boxes(boxes: Union[Iterable[BoundingBox], np.ndarray]) -> List[BoundingBox]:
+    """Order boxes top to bottom, then left to right (stable for ties).
+
+    Small lists are sorted in Python; larger sets, or an ``(N, 4)`` array, go
+    through ``np.lexsort`` so comparisons run on contiguous ints.
+    """
+
+    if not isinstance(boxes, np.ndarray):
+        boxes = list(boxes)
+        if len(boxes) < _LEXSORT_MIN_BOXES:
+            return sorted(boxes, key=lambda box: (box[1], box[0]))
+        boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+    order = np.lexsort((boxes[:, 0], boxes[:, 1]))
+    return list(map(tuple, boxes[order].tolist()))
 
 
-__all__: Iterable[str] = ["BoundingBox", "detect_text_regions"]
+__all__: Iterable[str] = ["BoundingBox", "detect_text_regions", "detect_text_regions_batched"]
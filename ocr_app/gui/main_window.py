@@ -1,17 +1,42 @@
 """PyQt6 GUI for the OCR application."""
 from __future__ import annotations
 
-import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Tuple
 
+import cv2
+import numpy as np
+from PIL import Image
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from ..config import config
-from ..core import pdf_loader
-from ..core.image_preprocess import preprocess_image
-from ..core.worker import PageTask, process_page
-from ..logging_utils import record_metrics, setup_logging
+from ..logging_utils import setup_logging
+from .ocr_runner import OcrRunner, start_pool
+
+# Longest side of the preview labels, in pixels.
+_PREVIEW_SIDE = 400
+
+
+def _preview_pixmap(image) -> QtGui.QPixmap:
+    """Wrap a PIL image or uint8 array in a pixmap fitted to ``_PREVIEW_SIDE``.
+
+    The page is resized with OpenCV first, so only the preview-sized buffer is
+    wrapped as a ``QImage`` (no ``ImageQt`` conversion of the full page).
+    """
+
+    if isinstance(image, Image.Image) and image.mode not in ("L", "RGB"):
+        image = image.convert("RGB")
+    pixels = np.asarray(image)
+    height, width = pixels.shape[:2]
+    factor = _PREVIEW_SIDE / max(height, width)
+    size = (max(1, round(width * factor)), max(1, round(height * factor)))
+    interpolation = cv2.INTER_AREA if factor < 1 else cv2.INTER_LINEAR
+    pixels = np.ascontiguousarray(cv2.resize(pixels, size, interpolation=interpolation))
+    image_format = QtGui.QImage.Format.Format_Grayscale8 if pixels.ndim == 2 else QtGui.QImage.Format.Format_RGB888
+    # copy() detaches the QImage from the numpy buffer before it is freed.
+    qimage = QtGui.QImage(pixels.data, size[0], size[1], pixels.strides[0], image_format).copy()
+    return QtGui.QPixmap.fromImage(qimage)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -23,8 +48,34 @@ class MainWindow(QtWidgets.QMainWindow):
         super().__init__()
         config.ensure_dirs()
         self.logger = setup_logging(gui_signal=self.log_signal)
+        self._ocr_thread: Optional[QtCore.QThread] = None
+        self._ocr_runner: Optional[OcrRunner] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_key: Optional[Tuple[str, Tuple[str, ...]]] = None
         self._build_ui()
         self.log_signal.connect(self._append_log)
+        # Load the default engine in the workers while the user is still picking files.
+        self._ensure_pool(self.engine_combo.currentText(), self._selected_languages())
+
+    def _ensure_pool(self, engine_name: str, languages: List[str]) -> ProcessPoolExecutor:
+        """Return the worker pool for these settings, replacing one built for others."""
+
+        key = (engine_name, tuple(languages))
+        if self._pool is None or self._pool_key != key:
+            self._shutdown_pool()
+            self._pool = start_pool(engine_name, languages, config.models, config.max_workers)
+            self._pool_key = key
+        return self._pool
+
+    def _shutdown_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._pool_key = None
+
+    def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # type: ignore[override]
+        self._shutdown_pool()
+        super().closeEvent(event)
 
     def _build_ui(self) -> None:
         self.setWindowTitle("Best-in-class OCR")
@@ -149,204 +200,47 @@ class MainWindow(QtWidgets.QMainWindow):
         if not files:
             QtWidgets.QMessageBox.warning(self, "Brak plików", "Dodaj pliki do przetworzenia")
             return
-        languages = self._selected_languages()
+        if self._ocr_thread is not None:
+            return
+
+        self.start_btn.setEnabled(False)
+        self.result_text.clear()
         engine_name = self.engine_combo.currentText()
-        dpi = self.dpi_spin.value()
-        preprocess_opts = self._preprocess_options()
-
-        results = []
-        metrics_rows = []
-        run_started = time.perf_counter()
-        for file_path in files:
-            file_start = time.perf_counter()
-            self.logger.info("Start przetwarzania pliku: %s", file_path)
-            if file_path.suffix.lower() == ".pdf":
-                try:
-                    load_start = time.perf_counter()
-                    page_images = [img for _, img in pdf_loader.load_pdf_pages(file_path, dpi=dpi)]
-                    load_duration = time.perf_counter() - load_start
-                    self.logger.info(
-                        "Wczytano PDF (%d stron) w %.3fs", len(page_images), load_duration
-                    )
-                    metrics_rows.append(
-                        {
-                            "file": str(file_path),
-                            "page": -1,
-                            "stage": "load",
-                            "duration_seconds": round(load_duration, 3),
-                            "engine": engine_name,
-                            "languages": "+".join(languages),
-                            "success": True,
-                            "error": "",
-                        }
-                    )
-                except Exception as exc:  # pragma: no cover - GUI dialog
-                    self.logger.exception("Nie udało się wczytać PDF: %s", file_path)
-                    metrics_rows.append(
-                        {
-                            "file": str(file_path),
-                            "page": -1,
-                            "stage": "load",
-                            "duration_seconds": 0.0,
-                            "engine": engine_name,
-                            "languages": "+".join(languages),
-                            "success": False,
-                            "error": str(exc),
-                        }
-                    )
-                    QtWidgets.QMessageBox.critical(
-                        self,
-                        "Błąd PDF",
-                        f"Nie udało się wczytać pliku {file_path.name}: {exc}",
-                    )
-                    continue
-            else:
-                from PIL import Image
-
-                try:
-                    load_start = time.perf_counter()
-                    page_images = [Image.open(file_path)]
-                    load_duration = time.perf_counter() - load_start
-                    self.logger.info("Wczytano obraz w %.3fs", load_duration)
-                    metrics_rows.append(
-                        {
-                            "file": str(file_path),
-                            "page": -1,
-                            "stage": "load",
-                            "duration_seconds": round(load_duration, 3),
-                            "engine": engine_name,
-                            "languages": "+".join(languages),
-                            "success": True,
-                            "error": "",
-                        }
-                    )
-                except Exception as exc:  # pragma: no cover - GUI dialog
-                    self.logger.exception("Nie udało się wczytać obrazu: %s", file_path)
-                    metrics_rows.append(
-                        {
-                            "file": str(file_path),
-                            "page": -1,
-                            "stage": "load",
-                            "duration_seconds": 0.0,
-                            "engine": engine_name,
-                            "languages": "+".join(languages),
-                            "success": False,
-                            "error": str(exc),
-                        }
-                    )
-                    QtWidgets.QMessageBox.critical(
-                        self,
-                        "Błąd obrazu",
-                        f"Nie udało się otworzyć pliku {file_path.name}: {exc}",
-                    )
-                    continue
-
-            page_texts = []
-            for page_index, image in enumerate(page_images):
-                task = PageTask(
-                    source_file=file_path,
-                    page_index=page_index,
-                    engine_name=engine_name,
-                    languages=languages,
-                    preprocess_options=preprocess_opts,
-                    tesseract_cmd=config.tesseract_cmd,
-                    model_config=config.models,
-                )
-                preprocess_start = time.perf_counter()
-                processed, _ = preprocess_image(image, preprocess_opts)
-                preprocess_duration = time.perf_counter() - preprocess_start
-                self.logger.info(
-                    "Preprocessing %s strona %d trwało %.3fs",
-                    file_path.name,
-                    page_index + 1,
-                    preprocess_duration,
-                )
-                metrics_rows.append(
-                    {
-                        "file": str(file_path),
-                        "page": page_index,
-                        "stage": "preprocess",
-                        "duration_seconds": round(preprocess_duration, 3),
-                        "engine": engine_name,
-                        "languages": "+".join(languages),
-                        "success": True,
-                        "error": "",
-                    }
-                )
-
-                # Update previews for the last processed page
-                self._update_previews(image, processed)
-
-                ocr_start = time.perf_counter()
-                try:
-                    result = process_page(image, task, preprocessed=processed)
-                    ocr_duration = time.perf_counter() - ocr_start
-                    self.logger.info(
-                        "OCR %s strona %d trwało %.3fs",
-                        file_path.name,
-                        page_index + 1,
-                        ocr_duration,
-                    )
-                    metrics_rows.append(
-                        {
-                            "file": str(file_path),
-                            "page": page_index,
-                            "stage": "ocr",
-                            "duration_seconds": round(ocr_duration, 3),
-                            "engine": engine_name,
-                            "languages": "+".join(languages),
-                            "success": True,
-                            "error": "",
-                        }
-                    )
-                    page_texts.append(result.text)
-                except Exception as exc:
-                    ocr_duration = time.perf_counter() - ocr_start
-                    self.logger.exception("Błąd OCR dla %s strona %d", file_path, page_index + 1)
-                    metrics_rows.append(
-                        {
-                            "file": str(file_path),
-                            "page": page_index,
-                            "stage": "ocr",
-                            "duration_seconds": round(ocr_duration, 3),
-                            "engine": engine_name,
-                            "languages": "+".join(languages),
-                            "success": False,
-                            "error": str(exc),
-                        }
-                    )
-            results.append("\n\n".join(page_texts))
-
-            total_duration = time.perf_counter() - file_start
-            self.logger.info("Zakończono plik %s w %.3fs", file_path, total_duration)
-            metrics_rows.append(
-                {
-                    "file": str(file_path),
-                    "page": -1,
-                        "stage": "file_total",
-                        "duration_seconds": round(total_duration, 3),
-                        "engine": engine_name,
-                        "languages": "+".join(languages),
-                        "success": True,
-                        "error": "",
-                    }
-                )
-
-        self.result_text.setPlainText("\n\n".join(results))
-        total_run = time.perf_counter() - run_started
-        self.logger.info("Cała sesja OCR trwała %.3fs", total_run)
-        record_metrics(metrics_rows)
+        languages = self._selected_languages()
+        runner = OcrRunner(
+            files,
+            engine_name,
+            languages,
+            self.dpi_spin.value(),
+            self._preprocess_options(),
+            config.models,
+            config.max_workers,
+            self.logger,
+            executor=self._ensure_pool(engine_name, languages),
+        )
+        thread = QtCore.QThread(self)
+        runner.moveToThread(thread)
+        thread.started.connect(runner.run)
+        runner.preview.connect(self._update_previews)
+        runner.failed.connect(self._show_error)
+        runner.finished.connect(self._ocr_finished)
+        runner.finished.connect(thread.quit)
+        thread.finished.connect(runner.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        self._ocr_thread, self._ocr_runner = thread, runner
+        thread.start()
+
+    def _show_error(self, title: str, message: str) -> None:
+        QtWidgets.QMessageBox.critical(self, title, message)
+
+    def _ocr_finished(self, text: str) -> None:
+        self.result_text.setPlainText(text)
+        self.start_btn.setEnabled(True)
+        if self._ocr_runner is not None and self._ocr_runner.pool_broken:
+            self._shutdown_pool()
+        self._ocr_thread = None
+        self._ocr_runner = None
 
     def _update_previews(self, original, processed) -> None:
-        def to_pixmap(img) -> QtGui.QPixmap:
-            from PIL import ImageQt
-
-            qim = ImageQt.ImageQt(img)
-            return QtGui.QPixmap.fromImage(qim)
-
-        self.preview_orig.setPixmap(
-            to_pixmap(original).scaled(400, 400, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
-        )
-        self.preview_proc.setPixmap(
-            to_pixmap(processed).scaled(400, 400, QtCore.Qt.AspectRatioMode.KeepAspectRatio)
-        )
+        self.preview_orig.setPixmap(_preview_pixmap(original))
+        self.preview_proc.setPixmap(_preview_pixmap(processed))
@@ -0,0 +1,243 @@
+"""Background OCR runner for the GUI: a QThread-hosted object feeding a process pool."""
+from __future__ import annotations
+
+import contextlib
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from PIL import Image
+from PyQt6 import QtCore
+
+from ..config import ModelConfig
+from ..core import pdf_loader
+from ..core.image_preprocess import preprocess_image
+from ..core.ocr_engine import OcrEngine
+from ..core.worker import init_worker_engine
+from ..logging_utils import record_metrics
+
+_worker_engine: Optional[OcrEngine] = None
+
+
+def _init_worker(engine_name: str, languages: List[str], tesseract_cmd: str, model_config: ModelConfig) -> None:
+    """Build the OCR engine once per worker process."""
+
+    global _worker_engine
+    _worker_engine = init_worker_engine(engine_name, languages, tesseract_cmd, model_config)
+
+
+def _worker_ready() -> None:
+    """No-op task; submitting it makes the pool start a worker and run its initializer."""
+
+
+def start_pool(
+    engine_name: str, languages: List[str], model_config: ModelConfig, max_workers: int
+) -> ProcessPoolExecutor:
+    """Start an OCR worker pool and have each worker load its engine right away.
+
+    Called ahead of the first run so model loading (and the GPU warm start of
+    neural engines) overlaps with the user picking files.
+    """
+
+    max_workers = max(1, max_workers)
+    # Spawned workers: forking a process that runs Qt and logging threads can deadlock.
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(engine_name, languages, model_config.tesseract_cmd, model_config),
+    )
+    # Spawn-context pools start workers on demand; one pending task per worker starts them all.
+    for _ in range(max_workers):
+        executor.submit(_worker_ready)
+    return executor
+
+
+def _ocr_page_bytes(
+    data: bytes, mode: str, size: Tuple[int, int], preprocess_options: dict, return_processed: bool
+) -> Tuple[str, float, float, Optional[Image.Image]]:
+    """Preprocess and OCR one page sent as raw pixels.
+
+    Returns the text, the preprocess and OCR durations, and the preprocessed
+    image when ``return_processed`` is set (used for the preview).
+    """
+
+    image = Image.frombytes(mode, size, data)
+    start = time.perf_counter()
+    processed, _ = preprocess_image(image, preprocess_options)
+    preprocess_duration = time.perf_counter() - start
+    start = time.perf_counter()
+    text = _worker_engine.run(processed).text
+    ocr_duration = time.perf_counter() - start
+    return text, preprocess_duration, ocr_duration, processed if return_processed else None
+
+
+class OcrRunner(QtCore.QObject):
+    """Runs OCR for a list of files off the GUI thread.
+
+    Move an instance to a ``QThread`` and connect ``thread.started`` to
+    :meth:`run`. Pages are preprocessed and recognized in a pool of
+    ``max_workers`` processes, each holding its own engine. While the pages of
+    one file are processed, the next file is already being loaded. Pass an
+    ``executor`` from :func:`start_pool` to reuse already warm workers; it is
+    left running afterwards.
+    """
+
+    file_done = QtCore.pyqtSignal(int, str)
+    preview = QtCore.pyqtSignal(object, object)
+    failed = QtCore.pyqtSignal(str, str)
+    finished = QtCore.pyqtSignal(str)
+
+    def __init__(
+        self,
+        files: List[Path],
+        engine_name: str,
+        languages: List[str],
+        dpi: int,
+        preprocess_options: dict,
+        model_config: ModelConfig,
+        max_workers: int,
+        logger: logging.Logger,
+        executor: Optional[ProcessPoolExecutor] = None,
+    ) -> None:
+        super().__init__()
+        self.files = files
+        self.engine_name = engine_name
+        self.languages = languages
+        self.dpi = dpi
+        self.preprocess_options = preprocess_options
+        self.model_config = model_config
+        self.max_workers = max(1, max_workers)
+        self.logger = logger
+        self.executor = executor
+        # Set when a worker died; the pool cannot take further tasks.
+        self.pool_broken = False
+        self._metrics_rows: List[Dict[str, object]] = []
+
+    def _metric(self, file_path: Path, page: int, stage: str, duration: float, error: str = "") -> None:
+        self._metrics_rows.append(
+            {
+                "file": str(file_path),
+                "page": page,
+                "stage": stage,
+                "duration_seconds": round(duration, 3),
+                "engine": self.engine_name,
+                "languages": "+".join(self.languages),
+                "success": not error,
+                "error": error,
+            }
+        )
+
+    def _load(self, file_path: Path) -> Optional[List[Image.Image]]:
+        is_pdf = file_path.suffix.lower() == ".pdf"
+        load_start = time.perf_counter()
+        try:
+            if is_pdf:
+                page_images = [img for _, img in pdf_loader.load_pdf_pages(file_path, dpi=self.dpi)]
+            else:
+                with Image.open(file_path) as image:
+                    image.load()
+                page_images = [image]
+        except Exception as exc:
+            if is_pdf:
+                self.logger.exception("Nie udało się wczytać PDF: %s", file_path)
+                self.failed.emit("Błąd PDF", f"Nie udało się wczytać pliku {file_path.name}: {exc}")
+            else:
+                self.logger.exception("Nie udało się wczytać obrazu: %s", file_path)
+                self.failed.emit("Błąd obrazu", f"Nie udało się otworzyć pliku {file_path.name}: {exc}")
+            self._metric(file_path, -1, "load", 0.0, str(exc))
+            return None
+        load_duration = time.perf_counter() - load_start
+        if is_pdf:
+            self.logger.info("Wczytano PDF (%d stron) w %.3fs", len(page_images), load_duration)
+        else:
+            self.logger.info("Wczytano obraz w %.3fs", load_duration)
+        self._metric(file_path, -1, "load", load_duration)
+        return page_images
+
+    def _submit(self, executor: ProcessPoolExecutor, page_images: List[Image.Image]) -> List[Future]:
+        futures = []
+        last = len(page_images) - 1
+        for page_index, image in enumerate(page_images):
+            if image.mode not in ("L", "RGB"):
+                image = image.convert("RGB")
+            futures.append(
+                executor.submit(
+                    _ocr_page_bytes,
+                    image.tobytes(),
+                    image.mode,
+                    image.size,
+                    self.preprocess_options,
+                    page_index == last,
+                )
+            )
+        return futures
+
+    def _collect(
+        self, file_index: int, file_path: Path, file_start: float, page_images: List[Image.Image], futures: List[Future]
+    ) -> str:
+        page_texts = []
+        for page_index, future in enumerate(futures):
+            try:
+                text, preprocess_duration, ocr_duration, processed = future.result()
+            except BrokenProcessPool:
+                # Every remaining page would fail the same way; abort the session.
+                self.pool_broken = True
+                raise
+            except Exception as exc:
+                self.logger.exception("Błąd OCR dla %s strona %d", file_path, page_index + 1)
+                self._metric(file_path, page_index, "ocr", 0.0, str(exc))
+                continue
+            self.logger.info(
+                "Preprocessing %s strona %d trwało %.3fs", file_path.name, page_index + 1, preprocess_duration
+            )
+            self._metric(file_path, page_index, "preprocess", preprocess_duration)
+            self.logger.info("OCR %s strona %d trwało %.3fs", file_path.name, page_index + 1, ocr_duration)
+            self._metric(file_path, page_index, "ocr", ocr_duration)
+            if processed is not None:
+                self.preview.emit(page_images[page_index], processed)
+            page_texts.append(text)
+
+        file_text = "\n\n".join(page_texts)
+        total_duration = time.perf_counter() - file_start
+        self.logger.info("Zakończono plik %s w %.3fs", file_path, total_duration)
+        self._metric(file_path, -1, "file_total", total_duration)
+        self.file_done.emit(file_index, file_text)
+        return file_text
+
+    @QtCore.pyqtSlot()
+    def run(self) -> None:
+        results: List[str] = []
+        run_started = time.perf_counter()
+        pending = None
+        try:
+            if self.executor is not None:
+                pool = contextlib.nullcontext(self.executor)
+            else:
+                pool = start_pool(self.engine_name, self.languages, self.model_config, self.max_workers)
+            with pool as executor:
+                for file_index, file_path in enumerate(self.files):
+                    file_start = time.perf_counter()
+                    self.logger.info("Start przetwarzania pliku: %s", file_path)
+                    page_images = self._load(file_path)
+                    if page_images is None:
+                        continue
+                    futures = self._submit(executor, page_images)
+                    # Collect the previous file while this one's pages are in the pool.
+                    if pending is not None:
+                        results.append(self._collect(*pending))
+                    pending = (file_index, file_path, file_start, page_images, futures)
+                if pending is not None:
+                    results.append(self._collect(*pending))
+        except Exception as exc:  # an exception escaping a slot would abort the Qt application
+            self.pool_broken = isinstance(exc, BrokenProcessPool)
+            self.logger.exception("Przetwarzanie OCR zostało przerwane")
+            self.failed.emit("Błąd OCR", f"Przetwarzanie zostało przerwane: {exc}")
+        finally:
+            self.logger.info("Cała sesja OCR trwała %.3fs", time.perf_counter() - run_started)
+            record_metrics(self._metrics_rows)
+            self.finished.emit("\n\n".join(results))
@@ -7,27 +7,47 @@ structured and easy to ingest by external tools.
 """
 from __future__ import annotations
 
-import json
 import logging
 import logging.config
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+import orjson
 
 
 class JsonFormatter(logging.Formatter):
-    """Format log records as a single-line JSON object."""
+    """Format log records as a single-line JSON object.
+
+    With a ``datefmt`` (second resolution) the formatted timestamp is reused
+    for all records logged within the same second.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (second, text) swapped as one tuple so concurrent handlers never see a torn pair.
+        self._timestamp_cache: Tuple[int, str] = (-1, "")
+
+    def _timestamp(self, record: logging.LogRecord) -> str:
+        if self.datefmt is None:
+            return self.formatTime(record)
+        second = int(record.created)
+        cached_second, text = self._timestamp_cache
+        if cached_second != second:
+            text = self.formatTime(record, self.datefmt)
+            self._timestamp_cache = (second, text)
+        return text
 
     def format(self, record: logging.LogRecord) -> str:  # type: ignore[override]
         payload = {
-            "timestamp": self.formatTime(record, self.datefmt),
+            "timestamp": self._timestamp(record),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
         if record.exc_info:
             payload["exception"] = self.formatException(record.exc_info)
-        return json.dumps(payload, ensure_ascii=False)
+        return orjson.dumps(payload).decode("utf-8")
 
 
 def build_logging_config(log_file: Path, level: str = "INFO") -> Dict[str, Any]:
@@ -4,22 +4,44 @@ from __future__ import annotations
 import csv
 import logging
 import logging.config
+import operator
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from .config import config
+from .config import load_config
 from .logging_config import configure_logging
 
 
+# GUI log flush period; ~30 Hz is smooth to read and keeps relayouts cheap.
+_GUI_FLUSH_INTERVAL_MS = 33
+
+
 class QtLogHandler(logging.Handler):
-    """Custom handler to forward log messages to a Qt signal."""
+    """Custom handler to forward log messages to a Qt signal.
+
+    Records are only buffered by :meth:`emit`; :meth:`flush` sends everything
+    gathered so far as one newline-joined message. Driven by a timer, this
+    turns a burst of records into a single widget update per tick. The buffer
+    keeps the newest 2000 lines.
+    """
 
     def __init__(self, signal=None) -> None:
         super().__init__()
         self.signal = signal
+        self._buf: deque[str] = deque(maxlen=2000)
+        self._timer = None
 
     def emit(self, record: logging.LogRecord) -> None:
-        msg = self.format(record)
+        self._buf.append(self.format(record))
+
+    def flush(self) -> None:
+        if not self._buf:
+            return
+        items = []
+        while self._buf:
+            items.append(self._buf.popleft())
+        msg = "\n".join(items)
         if self.signal:
             try:
                 self.signal.emit(msg)
@@ -27,11 +49,21 @@ class QtLogHandler(logging.Handler):
                 # Fall back to stdout if signal fails
                 print(msg)
 
+    def start_timer(self, interval_ms: int = _GUI_FLUSH_INTERVAL_MS) -> None:
+        """Flush periodically from the calling (GUI) thread's event loop."""
+
+        from PyQt6 import QtCore
+
+        self._timer = QtCore.QTimer()
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+        self._timer.start()
+
 
 def setup_logging(log_file: Optional[Path] = None, gui_signal=None) -> logging.Logger:
     """Configure root logger with file, console, and optional GUI handlers."""
 
-    cfg_file = log_file or config.log_file
+    cfg_file = log_file or load_config().log_file
     configure_logging(cfg_file)
     logger = logging.getLogger("ocr_app")
     logger.propagate = True
@@ -39,6 +71,7 @@ def setup_logging(log_file: Optional[Path] = None, gui_signal=None) -> logging.L
     if gui_signal is not None:
         gui_handler = QtLogHandler(gui_signal)
         gui_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"))
+        gui_handler.start_timer()
         logger.addHandler(gui_handler)
 
     return logger
@@ -47,15 +80,22 @@ def setup_logging(log_file: Optional[Path] = None, gui_signal=None) -> logging.L
 def record_metrics(rows: List[Dict[str, object]], metrics_file: Optional[Path] = None) -> None:
     """Append pipeline metrics to a CSV file."""
 
-    path = metrics_file or config.metrics_file
+    path = metrics_file or load_config().metrics_file
     path.parent.mkdir(parents=True, exist_ok=True)
     is_new = not path.exists()
     if not rows:
         return
 
-    with path.open("a", newline="", encoding="utf-8") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=sorted(rows[0].keys()))
+    fieldnames = sorted(rows[0].keys())
+    if len(fieldnames) == 1:
+        matrix = [(row[fieldnames[0]],) for row in rows]
+    else:
+        getter = operator.itemgetter(*fieldnames)
+        matrix = [getter(row) for row in rows]
+
+    # A 1 MiB buffer lets large batches reach the disk in a few writes.
+    with path.open("a", newline="", encoding="utf-8", buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile)
         if is_new:
-            writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+            writer.writerow(fieldnames)
+        writer.writerows(matrix)
@@ -11,7 +11,14 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence
+
+import numpy as np
+
+try:  # optional JIT; the pure-Python distance is used without it
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
 
 
 def levenshtein_distance(reference: Sequence[str], hypothesis: Sequence[str]) -> int:
@@ -50,22 +57,70 @@ def levenshtein_distance(reference: Sequence[str], hypothesis: Sequence[str]) ->
     return previous_row[-1]
 
 
+def _levenshtein_codes(reference: np.ndarray, hypothesis: np.ndarray) -> int:
+    """Levenshtein distance of two int32 code arrays using one reusable row."""
+    n = reference.shape[0]
+    m = hypothesis.shape[0]
+    if n == 0:
+        return m
+    if m == 0:
+        return n
+    row = np.empty(m + 1, np.int32)
+    for j in range(m + 1):
+        row[j] = j
+    for i in range(1, n + 1):
+        diagonal = row[0]
+        row[0] = i
+        ref_code = reference[i - 1]
+        for j in range(1, m + 1):
+            above = row[j]
+            best = diagonal if ref_code == hypothesis[j - 1] else diagonal + 1
+            if above + 1 < best:
+                best = above + 1
+            if row[j - 1] + 1 < best:
+                best = row[j - 1] + 1
+            row[j] = best
+            diagonal = above
+    return int(row[m])
+
+
+if njit is not None:
+    _levenshtein_codes = njit(cache=True, boundscheck=False)(_levenshtein_codes)
+
+
+def _char_codes(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le"), dtype=np.int32)
+
+
+def _word_codes(words: Sequence[str], vocabulary: Dict[str, int]) -> np.ndarray:
+    return np.fromiter((vocabulary.setdefault(word, len(vocabulary)) for word in words), np.int32, len(words))
+
+
 def compute_error_rates(records: Iterable[dict[str, str]]) -> tuple[float, float]:
     """Compute corpus-level CER and WER for a dataset."""
     total_char_errors = 0
     total_chars = 0
     total_word_errors = 0
     total_words = 0
+    vocabulary: Dict[str, int] = {}
 
     for record in records:
         ground_truth = record.get("ground_truth", "")
         prediction = record.get("prediction", "")
 
+        reference_words = ground_truth.split()
+        predicted_words = prediction.split()
         total_chars += len(ground_truth)
-        total_words += len(ground_truth.split())
-
-        total_char_errors += levenshtein_distance(list(ground_truth), list(prediction))
-        total_word_errors += levenshtein_distance(ground_truth.split(), prediction.split())
+        total_words += len(reference_words)
+
+        if njit is None:
+            total_char_errors += levenshtein_distance(ground_truth, prediction)
+            total_word_errors += levenshtein_distance(reference_words, predicted_words)
+        else:
+            total_char_errors += _levenshtein_codes(_char_codes(ground_truth), _char_codes(prediction))
+            total_word_errors += _levenshtein_codes(
+                _word_codes(reference_words, vocabulary), _word_codes(predicted_words, vocabulary)
+            )
 
     char_error_rate = total_char_errors / total_chars if total_chars else 0.0
     word_error_rate = total_word_errors / total_words if total_words else 0.0
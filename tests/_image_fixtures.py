@@ -0,0 +1,42 @@
+"""Deterministic test images, built once per size and shared between tests.
+
+The builders are memoized, so callers get the same object on every call and
+must treat it as read-only (use ``copy()`` before drawing on it).
+"""
+from functools import lru_cache
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+
+@lru_cache(maxsize=None)
+def _high_contrast_image(width: int = 80, height: int = 60) -> Image.Image:
+    """Create a simple black/white pattern image."""
+
+    image = Image.new("RGB", (width, height), color="white")
+    draw = ImageDraw.Draw(image)
+    for x in range(0, width, 8):
+        fill = "black" if (x // 8) % 2 == 0 else "white"
+        draw.rectangle([x, 0, x + 7, height], fill=fill)
+    return image
+
+
+@lru_cache(maxsize=None)
+def _color_gradient_image(width: int = 90, height: int = 60) -> Image.Image:
+    """Create a small RGB gradient image for scale tests."""
+
+    xs, ys = np.meshgrid(np.arange(width, dtype=np.float64), np.arange(height, dtype=np.float64))
+    # astype truncates like int() for these non-negative values.
+    channels = (255 * xs / (width - 1), 255 * ys / (height - 1), 255 * (xs + ys) / (width + height - 2))
+    return Image.fromarray(np.stack(channels, axis=-1).astype(np.uint8), "RGB")
+
+
+@lru_cache(maxsize=None)
+def _generate_sample_image(width: int = 200, height: int = 80) -> Image.Image:
+    """Create a page-like RGB image: dark text and a rule on a white background."""
+
+    image = Image.new("RGB", (width, height), color="white")
+    draw = ImageDraw.Draw(image)
+    draw.text((10, 10), "Hello OCR", fill="black")
+    draw.rectangle([10, height - 20, width - 10, height - 16], fill="black")
+    return image
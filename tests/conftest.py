@@ -0,0 +1,35 @@
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from tests._image_fixtures import _color_gradient_image, _generate_sample_image, _high_contrast_image
+
+
+@pytest.fixture(scope="session")
+def sample_image() -> Image.Image:
+    return _generate_sample_image()
+
+
+@pytest.fixture(scope="session")
+def high_contrast_image() -> Image.Image:
+    return _high_contrast_image()
+
+
+@pytest.fixture(scope="session")
+def gradient_image() -> Image.Image:
+    return _color_gradient_image()
+
+
+@pytest.fixture(scope="session")
+def sample_pdf(tmp_path_factory) -> Path:
+    """Two-page text PDF shared by the whole session; tests that modify it must copy it first."""
+
+    fitz = pytest.importorskip("fitz")
+    path = tmp_path_factory.mktemp("pdf") / "sample_document.pdf"
+    doc = fitz.open()
+    for number in (1, 2):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Sample page {number}")
+    doc.save(path)
+    return path
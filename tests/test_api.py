@@ -0,0 +1,32 @@
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from ocr_app import api  # noqa: E402
+from ocr_app.core.ocr_service import PageOcrResult  # noqa: E402
+
+
+def test_ocr_path_endpoint_runs_ocr_on_existing_file(monkeypatch, tmp_path):
+    target = tmp_path / "scan.png"
+    target.write_bytes(b"not really a png")
+    calls = []
+
+    def fake_run_ocr_on_path(path, engine, languages, preprocess_options, dpi, tesseract_cmd):
+        calls.append((path, engine, tesseract_cmd))
+        return [PageOcrResult(page_index=0, text="tekst", confidence=88.0)]
+
+    monkeypatch.setattr(api, "run_ocr_on_path", fake_run_ocr_on_path)
+    response = TestClient(api.app).post("/ocr/path", json={"path": str(target), "engine": "tesseract"})
+
+    assert response.status_code == 200
+    assert response.json()["pages"][0]["text"] == "tekst"
+    assert calls == [(target, "tesseract", api.config.models.tesseract_cmd)]
+
+
+def test_ocr_path_endpoint_reports_missing_file(tmp_path):
+    response = TestClient(api.app).post("/ocr/path", json={"path": str(tmp_path / "missing.png")})
+
+    assert response.status_code == 404
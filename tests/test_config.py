@@ -1,3 +1,4 @@
+import importlib
 import pytest
 from pathlib import Path
 
@@ -52,3 +53,88 @@ app:
     message = str(excinfo.value)
     assert "pdf.dpi musi być dodatnią liczbą całkowitą" in message
     assert "app.max_workers musi być dodatnią liczbą całkowitą" in message
+
+
+def test_load_config_reuses_json_cache(tmp_path):
+    from ocr_app.config import _load_config_cached
+
+    cfg_path = tmp_path / "config.yml"
+    cfg_path.write_text(
+        f"""
+languages:
+  default: [eng]
+app:
+  temp_dir: {tmp_path / "tmp"}
+preprocess:
+  deskew: false
+"""
+    )
+    original = load_config(cfg_path)
+    cache_path = tmp_path / "config.yml.cache.json"
+    assert cache_path.exists()
+
+    _load_config_cached.cache_clear()
+    cached = load_config(cfg_path)
+
+    assert cached is not original
+    assert cached == original
+    assert cached.temp_dir == tmp_path / "tmp"
+    assert cached.default_languages == ("eng",)
+
+
+def test_paddle_missing_paths_checks_siblings(tmp_path):
+    from ocr_app.config import PaddleModelPaths
+
+    (tmp_path / "det").mkdir()
+    paths = PaddleModelPaths(
+        det_model_dir=tmp_path / "det",
+        rec_model_dir=tmp_path / "rec",
+        cls_model_dir=tmp_path / "other" / "cls",
+    )
+
+    assert paths.missing_paths() == [tmp_path / "rec", tmp_path / "other" / "cls"]
+
+
+def test_load_config_reuses_cache_when_yaml_touched_but_unchanged(tmp_path, monkeypatch):
+    import os
+
+    config_module = importlib.import_module("ocr_app.config")
+
+    cfg_path = tmp_path / "config.yml"
+    cfg_path.write_text("pdf:\n  dpi: 200\n")
+    load_config(cfg_path)
+    cache_path = tmp_path / "config.yml.cache.json"
+    stat = cache_path.stat()
+    os.utime(cfg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema should not be re-validated")
+
+    monkeypatch.setattr(config_module, "_normalize_schema", fail)
+    config_module._load_config_cached.cache_clear()
+
+    assert load_config(cfg_path).pdf_dpi == 200
+
+
+def test_load_config_ignores_cache_when_yaml_edited_with_older_mtime(tmp_path):
+    import os
+
+    config_module = importlib.import_module("ocr_app.config")
+
+    cfg_path = tmp_path / "config.yml"
+    cfg_path.write_text("pdf:\n  dpi: 200\n")
+    load_config(cfg_path)
+    cache_path = tmp_path / "config.yml.cache.json"
+    stat = cache_path.stat()
+    cfg_path.write_text("pdf:\n  dpi: 300\n")
+    os.utime(cfg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 10**9))
+    config_module._load_config_cached.cache_clear()
+
+    assert load_config(cfg_path).pdf_dpi == 300
+
+
+def test_package_config_is_the_settings_instance():
+    from ocr_app import OCRConfig, config
+
+    assert isinstance(config, OCRConfig)
+    assert config is importlib.import_module("ocr_app.config").config
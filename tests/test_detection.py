@@ -0,0 +1,57 @@
+import pytest
+from PIL import Image
+
+pytest.importorskip("cv2", exc_type=ImportError)
+
+from ocr_app.detection import _easyocr_boxes  # noqa: E402
+
+
+def test_easyocr_boxes_flattens_and_clips_detections():
+    image = Image.new("RGB", (100, 50), color="white")
+    horizontal = [[10, 40, 5, 20], [-3, 120, 30, 60]]
+    free = [[[1.5, 2], [9, 2.2], [9.9, 8], [1, 8]]]
+
+    assert _easyocr_boxes(horizontal, free, image) == [(1, 2, 9, 8), (10, 5, 40, 20), (0, 30, 100, 50)]
+    assert _easyocr_boxes([], [], image) == []
+
+
+def test_sort_boxes_array_path_matches_python_sort():
+    from ocr_app.detection import _sort_boxes
+
+    boxes = [((i * 37) % 50, (i * 11) % 7 * 10, (i * 37) % 50 + 5, (i * 11) % 7 * 10 + 5) for i in range(100)]
+
+    assert _sort_boxes(boxes) == sorted(boxes, key=lambda box: (box[1], box[0]))
+    assert _sort_boxes(boxes[:5]) == sorted(boxes[:5], key=lambda box: (box[1], box[0]))
+
+
+@pytest.mark.parametrize("device", ["cpu", "cuda"])
+def test_detect_text_regions_passes_stacked_rgb_batch(monkeypatch, device):
+    from types import SimpleNamespace
+
+    import numpy as np
+
+    from ocr_app import detection
+
+    calls = []
+
+    class FakeReader:
+        def __init__(self, languages, **kwargs):
+            self.device = device
+
+        def detect(self, batch, **kwargs):
+            calls.append((batch.shape, batch.dtype, kwargs))
+            return [[[1, 5, 2, 6]] for _ in batch], [[] for _ in batch]
+
+    monkeypatch.setattr(detection, "_safe_import_easyocr", lambda: SimpleNamespace(Reader=FakeReader))
+    detection._get_reader.cache_clear()
+    try:
+        boxes = detection.detect_text_regions(Image.new("L", (20, 10), color=255), languages=["en"])
+    finally:
+        detection._get_reader.cache_clear()
+
+    assert boxes == [(1, 2, 5, 6)]
+    expected = [((1, 10, 20, 3), np.uint8, {"min_size": 8, "reformat": False})]
+    if device == "cuda":
+        side = detection._WARMUP_SIDE
+        expected.insert(0, ((detection._DETECT_BATCH_SIZE, side, side, 3), np.uint8, {"min_size": 8, "reformat": False}))
+    assert calls == expected
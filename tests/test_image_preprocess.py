@@ -1,36 +1,16 @@
 import numpy as np
 import pytest
-from PIL import Image, ImageDraw
 
 from ocr_app.config import OCRConfig
+from tests._image_fixtures import _generate_sample_image, _high_contrast_image
 
 pytest.importorskip("cv2", exc_type=ImportError)
 
 from ocr_app.core.image_preprocess import preprocess_image  # noqa: E402
 
-
-def _high_contrast_image(width: int = 80, height: int = 60) -> Image.Image:
-    """Create a simple black/white pattern image."""
-
-    image = Image.new("RGB", (width, height), color="white")
-    draw = ImageDraw.Draw(image)
-    for x in range(0, width, 8):
-        fill = "black" if (x // 8) % 2 == 0 else "white"
-        draw.rectangle([x, 0, x + 7, height], fill=fill)
-    return image
-
-
-def _color_gradient_image(width: int = 90, height: int = 60) -> Image.Image:
-    """Create a small RGB gradient image for scale tests."""
-
-    image = Image.new("RGB", (width, height))
-    for x in range(width):
-        for y in range(height):
-            r = int(255 * x / (width - 1))
-            g = int(255 * y / (height - 1))
-            b = int(255 * (x + y) / (width + height - 2))
-            image.putpixel((x, y), (r, g, b))
-    return image
+# Built once; tests copy the options before changing them.
+_DEFAULT_CFG = OCRConfig()
+_DEFAULT_OPTS = dict(_DEFAULT_CFG.preprocess_options)
 
 
 def test_config_contains_expected_preprocess_defaults():
@@ -45,44 +25,44 @@ def test_config_contains_expected_preprocess_defaults():
     }
 
 
-def test_preprocess_thresholds_high_contrast_image():
-    image = _high_contrast_image()
+@pytest.mark.parametrize("factory", [_high_contrast_image, _generate_sample_image])
+def test_preprocess_thresholds_high_contrast_image(factory):
+    image = factory()
 
-    config = OCRConfig()
-    options = {**config.preprocess_options, "scale_up": False, "deskew": False}
+    options = {**_DEFAULT_OPTS, "scale_up": False, "deskew": False}
 
     processed, metrics = preprocess_image(image, options)
 
     assert metrics == {}
-    arr = np.array(processed)
+    # asarray reads PIL's buffer through __array_interface__; the tests only read it.
+    arr = np.asarray(processed)
     assert processed.mode == "RGB"
     # thresholding should produce binary channels
-    unique_values = np.unique(arr[:, :, 0])
-    assert set(unique_values).issubset({0, 255})
-    assert np.array_equal(arr[:, :, 0], arr[:, :, 1])
-    assert np.array_equal(arr[:, :, 1], arr[:, :, 2])
+    first_channel = arr[:, :, 0]
+    assert ((first_channel == 0) | (first_channel == 255)).all()
+    # Gray replicated into RGB: every channel equals the first (one broadcast compare).
+    assert np.all(arr == arr[:, :, :1])
 
 
-def test_preprocess_respects_disabled_threshold_and_scale():
-    image = _high_contrast_image()
+def test_preprocess_respects_disabled_threshold_and_scale(gradient_image):
+    # A pure black/white input can never show a third tone; the gradient can.
+    image = gradient_image
 
-    config = OCRConfig()
-    options = {**config.preprocess_options}
+    options = {**_DEFAULT_OPTS}
     options.update({"threshold": False, "scale_up": False, "deskew": False})
 
     processed, _ = preprocess_image(image, options)
 
-    arr = np.array(processed)
+    arr = np.asarray(processed)
     assert processed.size == image.size
     # Without thresholding we expect more than two tone values
-    assert len(np.unique(arr[:, :, 0])) > 2
+    assert np.unique(arr[:, :, 0]).size > 2
 
 
-def test_preprocess_scales_image_from_config():
-    image = _color_gradient_image()
+def test_preprocess_scales_image_from_config(gradient_image):
+    image = gradient_image
 
-    config = OCRConfig()
-    options = {**config.preprocess_options}
+    options = {**_DEFAULT_OPTS}
     options.update({"threshold": False, "deskew": False})
 
     processed, _ = preprocess_image(image, options)
@@ -91,3 +71,63 @@ def test_preprocess_scales_image_from_config():
     assert processed.size == expected_size
     # Pipeline keeps PIL RGB mode after conversions
     assert processed.mode == "RGB"
+
+
+def test_skew_angle_on_downsampled_large_page():
+    import cv2
+
+    from ocr_app.core.image_preprocess import _skew_angle
+
+    page = np.full((2400, 1800), 255, dtype=np.uint8)
+    cv2.rectangle(page, (400, 400), (1400, 2000), 0, -1)
+    matrix = cv2.getRotationMatrix2D((900, 1200), 5, 1.0)
+    rotated = cv2.warpAffine(page, matrix, (1800, 2400), borderValue=255)
+
+    assert abs(abs(_skew_angle(rotated)) - 5) < 0.5
+
+
+def test_preprocess_pages_matches_sequential_order():
+    from ocr_app.core.image_preprocess import preprocess_pages
+
+    images = [_high_contrast_image(width=80 + 8 * i) for i in range(4)]
+    options = {**_DEFAULT_OPTS, "scale_up": False, "deskew": False}
+
+    results = preprocess_pages(images, options, max_workers=2)
+
+    expected = [preprocess_image(image, options)[0] for image in images]
+    assert all(np.array_equal(np.asarray(img), np.asarray(exp)) for (img, _), exp in zip(results, expected))
+    assert len(results) == len(expected)
+
+
+def test_preprocess_options_from_mapping_ignores_unknown_keys(high_contrast_image):
+    from ocr_app.core.image_preprocess import PreprocessOptions
+
+    options = PreprocessOptions.from_mapping({"deskew": True, "threshold": False, "unknown": True})
+
+    assert options == PreprocessOptions(deskew=True, threshold=False)
+    image = high_contrast_image
+    expected, _ = preprocess_image(image, {"deskew": True, "threshold": False})
+    processed, _ = preprocess_image(image, options)
+    assert np.array_equal(np.asarray(processed), np.asarray(expected))
+
+
+@pytest.mark.parametrize("grayscale", [True, False])
+def test_preprocess_accepts_rgb_array(grayscale, gradient_image):
+    image = gradient_image
+    options = {**_DEFAULT_OPTS, "grayscale": grayscale, "deskew": False}
+
+    from_array, _ = preprocess_image(np.asarray(image), options)
+    from_pil, _ = preprocess_image(image, options)
+
+    assert np.array_equal(np.asarray(from_array), np.asarray(from_pil))
+
+
+def test_preprocess_with_all_steps_disabled_returns_input(gradient_image):
+    image = gradient_image
+    options = {name: False for name in _DEFAULT_OPTS}
+
+    processed, _ = preprocess_image(image, options)
+    from_gray, _ = preprocess_image(image.convert("L"), options)
+
+    assert processed is image
+    assert from_gray.mode == "RGB" and from_gray.size == image.size
@@ -5,11 +5,10 @@ pytest.importorskip("cv2", exc_type=ImportError)
 from ocr_app.core.worker import PageTask, process_page
 from ocr_app.core.ocr_engine import OcrResult, OcrEngine
 from ocr_app.core.postprocess import clean_text, merge_pages
-from tests.test_image_preprocess import _generate_sample_image
 
 
-def test_full_pipeline_with_mocked_ocr(monkeypatch, tmp_path):
-    image = _generate_sample_image()
+def test_full_pipeline_with_mocked_ocr(monkeypatch, tmp_path, sample_image):
+    image = sample_image
     image_path = tmp_path / "sample_image.png"
     image.save(image_path)
 
@@ -0,0 +1,37 @@
+import csv
+
+from ocr_app.logging_utils import record_metrics
+
+
+def test_record_metrics_appends_rows_with_single_header(tmp_path):
+    path = tmp_path / "metrics.csv"
+
+    record_metrics([{"stage": "ocr", "duration_seconds": 0.5}, {"stage": "load", "duration_seconds": 1.0}], path)
+    record_metrics([{"stage": "file_total", "duration_seconds": 1.5}], path)
+
+    with path.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert rows == [
+        {"duration_seconds": "0.5", "stage": "ocr"},
+        {"duration_seconds": "1.0", "stage": "load"},
+        {"duration_seconds": "1.5", "stage": "file_total"},
+    ]
+
+
+def test_json_formatter_reuses_timestamp_within_a_second():
+    import logging
+
+    import orjson
+
+    from ocr_app.logging_config import JsonFormatter
+
+    formatter = JsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+    first = logging.makeLogRecord({"name": "ocr_app", "levelname": "INFO", "msg": "zażółć", "created": 100.2})
+    second = logging.makeLogRecord({"name": "ocr_app", "levelname": "INFO", "msg": "b", "created": 100.9})
+    later = logging.makeLogRecord({"name": "ocr_app", "levelname": "INFO", "msg": "c", "created": 101.0})
+
+    payloads = [orjson.loads(formatter.format(record)) for record in (first, second, later)]
+
+    assert payloads[0]["message"] == "zażółć"
+    assert payloads[0]["timestamp"] == payloads[1]["timestamp"] == formatter.formatTime(first, formatter.datefmt)
+    assert payloads[2]["timestamp"] == formatter.formatTime(later, formatter.datefmt)
@@ -1,23 +1,123 @@
-from ocr_app.core.ocr_engine import OcrEngine, OcrResult
-from tests.test_image_preprocess import _generate_sample_image
+import subprocess
+import sys
 
+import numpy as np
 
-def test_tesseract_engine_uses_pytesseract(monkeypatch):
+from ocr_app.config import ModelConfig
+from ocr_app.core import ocr_engine
+from ocr_app.core.ocr_engine import BoxColumns, OcrEngine, OcrResult, _fit_to_side, get_engine
+
+
+def test_tesseract_engine_uses_pytesseract(monkeypatch, sample_image):
     captured = {}
 
-    def fake_image_to_string(image, lang):
-        captured["lang"] = lang
-        captured["size"] = image.size
-        return "mocked text"
+    def fake_image_to_data(image, lang, config, output_type):
+        captured.update(lang=lang, config=config, size=image.size)
+        return {
+            "level": [5, 5],
+            "page_num": [1, 1],
+            "block_num": [1, 1],
+            "par_num": [1, 1],
+            "line_num": [1, 1],
+            "word_num": [1, 2],
+            "left": [4, 40],
+            "top": [5, 5],
+            "width": [30, 25],
+            "height": [12, 12],
+            "conf": ["91.5", "88.5"],
+            "text": ["mocked", "text"],
+        }
 
-    monkeypatch.setattr("pytesseract.image_to_string", fake_image_to_string)
+    real_lazy_import = ocr_engine._lazy_import
+    # Force the pytesseract path even where tesserocr is installed.
+    monkeypatch.setattr(ocr_engine, "_lazy_import", lambda name: None if name == "tesserocr" else real_lazy_import(name))
+    monkeypatch.setattr("pytesseract.image_to_data", fake_image_to_data)
 
-    engine = OcrEngine(engine_name="tesseract", languages=["eng", "pol"])
-    image = _generate_sample_image()
+    model_config = ModelConfig(tesseract_oem=1, tesseract_psm=6)
+    engine = OcrEngine(engine_name="tesseract", languages=["eng", "pol"], model_config=model_config)
+    image = sample_image
 
     result = engine.run(image)
 
     assert isinstance(result, OcrResult)
     assert result.text == "mocked text"
+    assert result.confidence == 90.0
     assert captured["lang"] == "eng+pol"
+    assert captured["config"] == "--oem 1 --psm 6"
     assert captured["size"] == image.size
+
+
+def test_run_batch_keeps_input_order_for_tesseract(monkeypatch, sample_image):
+    def fake_run_tesseract(self, image):
+        return OcrResult(text=f"{image.size[0]}x{image.size[1]}")
+
+    monkeypatch.setattr(OcrEngine, "_run_tesseract", fake_run_tesseract)
+
+    engine = OcrEngine(engine_name="tesseract", languages=["eng"])
+    images = [sample_image.resize((40 + 10 * idx, 30)) for idx in range(5)]
+
+    results = engine.run_batch(images)
+
+    assert [result.text for result in results] == [f"{40 + 10 * idx}x30" for idx in range(5)]
+
+
+def test_get_engine_reuses_instances_per_settings():
+    first = get_engine("tesseract", ["eng", "pol"])
+
+    assert get_engine("Tesseract", ("eng", "pol")) is first
+    assert get_engine("tesseract", ["pol"]) is not first
+
+
+def test_parse_tsv_matches_image_to_data_layout():
+    from ocr_app.core.ocr_engine import _parse_tsv
+
+    tsv = "1\t1\t0\t0\t0\t0\t0\t0\t100\t40\t-1\t\n5\t1\t1\t1\t1\t1\t4\t5\t30\t12\t91.5\tHello\n"
+
+    data = _parse_tsv(tsv)
+
+    assert data["text"] == ["", "Hello"]
+    assert data["conf"] == ["-1", "91.5"]
+    assert data["left"] == ["0", "4"]
+
+
+def test_tesseract_result_groups_words_into_lines():
+    data = {
+        "text": ["", "Hello", "world", " ", "Next"],
+        "conf": ["-1", "90", "80", "-1", "-1"],
+        "left": [0, 1, 20, 0, 1],
+        "top": [0, 2, 2, 0, 30],
+        "width": [100, 10, 12, 0, 15],
+        "height": [50, 8, 8, 0, 8],
+        "page_num": [1, 1, 1, 1, 1],
+        "block_num": [0, 1, 1, 1, 1],
+        "par_num": [0, 1, 1, 1, 1],
+        "line_num": [0, 1, 1, 1, 2],
+    }
+
+    result = OcrEngine._tesseract_result(data)
+
+    assert result.text == "Hello world\nNext"
+    assert result.confidence == 85.0
+    assert result.boxes.to_dicts()[2] == {
+        "text": "Next",
+        "bbox": {"x": 1, "y": 30, "width": 15, "height": 8},
+        "confidence": None,
+    }
+
+
+def test_importing_service_does_not_load_neural_backends():
+    code = (
+        "import sys, ocr_app.core.ocr_service; "
+        "print(sorted({'paddleocr', 'easyocr', 'torch', 'paddle'} & set(sys.modules)))"
+    )
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert output.stdout.strip() == "[]"
+
+
+def test_fit_to_side_downscales_and_boxes_scale_back():
+    array, factor = _fit_to_side(np.zeros((3000, 4000, 3), dtype=np.uint8), 1600)
+    assert array.shape == (1200, 1600, 3)
+    assert factor == 2.5
+
+    boxes = BoxColumns.from_dicts([{"text": "a", "bbox": {"x": 2, "y": 4, "width": 10, "height": 6}, "confidence": 0.5}])
+    assert boxes.scaled(factor).to_dicts()[0]["bbox"] == {"x": 5, "y": 10, "width": 25, "height": 15}
@@ -1,32 +1,76 @@
-from pathlib import Path
+import shutil
 
 import pytest
 
 fitz = pytest.importorskip("fitz")
 
-from ocr_app.core.pdf_loader import count_pages, load_pdf_pages
+from ocr_app.core.pdf_loader import (
+    count_pages,
+    load_pdf_pages,
+    load_pdf_pages_from_bytes,
+    load_pdf_pages_gray,
+    load_pdf_pages_parallel,
+)
 
 
-def _make_sample_pdf(path: Path) -> None:
-    doc = fitz.open()
-    for number in (1, 2):
-        page = doc.new_page()
-        page.insert_text((72, 72), f"Sample page {number}")
-    doc.save(path)
+def test_count_pages_returns_length(sample_pdf):
+    assert count_pages(sample_pdf) == 2
 
 
-def test_count_pages_returns_length(tmp_path):
-    pdf_path = tmp_path / "sample_document.pdf"
-    _make_sample_pdf(pdf_path)
-    assert count_pages(pdf_path) == 2
-
-
-def test_load_pdf_pages_yields_images(tmp_path):
-    pdf_path = tmp_path / "sample_document.pdf"
-    _make_sample_pdf(pdf_path)
-    pages = list(load_pdf_pages(pdf_path, dpi=72))
+def test_load_pdf_pages_yields_images(sample_pdf):
+    pages = list(load_pdf_pages(sample_pdf, dpi=72))
     assert len(pages) == 2
     for index, image in pages:
         assert isinstance(index, int)
         assert image.mode == "RGB"
         assert image.size[0] > 0 and image.size[1] > 0
+
+
+def test_load_pdf_pages_parallel_matches_sequential(sample_pdf):
+    sequential = list(load_pdf_pages(sample_pdf, dpi=72))
+    parallel = list(load_pdf_pages_parallel(sample_pdf, dpi=72, workers=2))
+    assert [index for index, _ in parallel] == [0, 1]
+    for (_, expected), (_, image) in zip(sequential, parallel):
+        assert image.tobytes() == expected.tobytes()
+
+
+def test_load_pdf_pages_from_bytes_matches_file(sample_pdf):
+    from_file = list(load_pdf_pages(sample_pdf, dpi=72))
+    from_bytes = list(load_pdf_pages_from_bytes(sample_pdf.read_bytes(), dpi=72))
+    assert [index for index, _ in from_bytes] == [0, 1]
+    for (_, expected), (_, image) in zip(from_file, from_bytes):
+        assert image.tobytes() == expected.tobytes()
+
+
+def test_load_pdf_pages_as_numpy_matches_pil(sample_pdf):
+    images = list(load_pdf_pages(sample_pdf, dpi=72))
+    arrays = list(load_pdf_pages(sample_pdf, dpi=72, as_numpy=True))
+    assert [index for index, _ in arrays] == [0, 1]
+    for (_, expected), (_, array) in zip(images, arrays):
+        assert array.shape == (expected.size[1], expected.size[0], 3)
+        assert array.tobytes() == expected.tobytes()
+
+
+def test_load_pdf_pages_gray_yields_single_channel(sample_pdf):
+    color = list(load_pdf_pages(sample_pdf, dpi=72))
+    gray = list(load_pdf_pages_gray(sample_pdf, dpi=72))
+    assert [index for index, _ in gray] == [0, 1]
+    for (_, rgb), (_, image) in zip(color, gray):
+        assert image.mode == "L"
+        assert image.size == rgb.size
+
+
+def test_count_pages_falls_back_for_incremental_updates(sample_pdf, tmp_path):
+    from ocr_app.core.pdf_loader import _scan_page_count
+
+    # This test appends to the file, so it works on a private copy.
+    pdf_path = tmp_path / "sample_document.pdf"
+    shutil.copyfile(sample_pdf, pdf_path)
+    assert _scan_page_count(pdf_path) == 2
+
+    with fitz.open(pdf_path) as doc:
+        doc.new_page()
+        doc.saveIncr()
+
+    assert _scan_page_count(pdf_path) is None
+    assert count_pages(pdf_path) == 3
@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+from ocr_app.core.pipeline import run_staged
+
+
+def test_run_staged_preserves_order_across_stages():
+    results = list(run_staged(range(20), (lambda x: x * 2, lambda x: x + 1), maxsize=2))
+
+    assert results == [x * 2 + 1 for x in range(20)]
+
+
+def test_run_staged_reraises_stage_errors():
+    def failing(value):
+        if value == 3:
+            raise ValueError("boom")
+        return value
+
+    with pytest.raises(ValueError, match="boom"):
+        list(run_staged(range(10), (failing,)))
+
+
+def test_run_staged_stops_workers_when_abandoned():
+    closed = []
+
+    def source():
+        try:
+            for value in range(1000):
+                yield value
+        finally:
+            closed.append(True)
+
+    before = set(threading.enumerate())
+    results = run_staged(source(), (lambda x: x,), maxsize=1)
+    assert next(results) == 0
+    workers = set(threading.enumerate()) - before
+    results.close()
+
+    for worker in workers:
+        worker.join(timeout=5)
+
+    assert not any(worker.is_alive() for worker in workers)
+    assert closed == [True]
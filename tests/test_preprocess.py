@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+from PIL import Image, ImageDraw
+
+cv2 = pytest.importorskip("cv2", exc_type=ImportError)
+
+from ocr_app.preprocess import _deskew_array  # noqa: E402
+
+
+def _ragged_text_block(width: int = 1200, height: int = 1600) -> np.ndarray:
+    """Lines of varying length; their uneven right edge skews second-moment estimates."""
+
+    image = Image.new("L", (width, height), 255)
+    draw = ImageDraw.Draw(image)
+    for y in range(150, height - 150, 45):
+        draw.rectangle((120, y, width - 120 - (y * 7) % 300, y + 14), fill=0)
+    return np.asarray(image)
+
+
+@pytest.mark.parametrize("angle", [-7, 3])
+def test_deskew_straightens_ragged_text_block(angle):
+    page = _ragged_text_block()
+    height, width = page.shape
+    matrix = cv2.getRotationMatrix2D((width // 2, height // 2), angle, 1.0)
+    rotated = cv2.warpAffine(page, matrix, (width, height), borderValue=255)
+
+    straightened = _deskew_array(rotated)
+
+    # Rows of text become horizontal again: each ink row is nearly fully dark or blank.
+    ink = (straightened < 128).mean(axis=1)
+    assert np.mean((ink > 0.02) & (ink < 0.5)) < 0.05
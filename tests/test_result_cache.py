@@ -0,0 +1,38 @@
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+
+from ocr_app.config import ModelConfig
+from ocr_app.core import ocr_service
+from ocr_app.core.result_cache import ResultCache, cache_key
+
+
+def test_cache_key_depends_on_bytes_and_params():
+    key = cache_key([b"abc"], engine="tesseract", languages=["pol"])
+    assert key == cache_key([b"a", b"bc"], languages=["pol"], engine="tesseract")
+    assert key != cache_key([b"abd"], engine="tesseract", languages=["pol"])
+    assert key != cache_key([b"abc"], engine="tesseract", languages=["eng"])
+
+
+def test_result_cache_roundtrip(tmp_path):
+    cache = ResultCache(tmp_path / "results.sqlite")
+    pages = [{"page_index": 0, "text": "tekst", "confidence": 91.5, "boxes": []}]
+
+    assert cache.get("missing") is None
+    cache.put("key", pages)
+    assert cache.get("key") == pages
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [{"tesseract_oem": 1}, {"tesseract_psm": 6}, {"max_input_side": 0}],
+)
+def test_cache_params_depend_on_model_settings(monkeypatch, changes):
+    def key_for(models):
+        monkeypatch.setattr(ocr_service, "load_config", lambda: SimpleNamespace(models=models))
+        return cache_key([b"abc"], **ocr_service._cache_params("tesseract", ["pol"], {}, 300, ""))
+
+    base = ModelConfig()
+    assert key_for(base) == key_for(ModelConfig())
+    assert key_for(base) != key_for(replace(base, **changes))